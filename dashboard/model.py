@@ -35,8 +35,8 @@ class DashboardShotManager(ShotManager):
         super().__init__(*args, **kwargs)
         self.completed_shots: list[dict] = []
 
-    def _close_shot(self, shot: dict):
-        super()._close_shot(shot)
+    def _close_shot(self, shot: dict, *, save_state: bool = True):
+        super()._close_shot(shot, save_state=save_state)
         images_by_camera = shot.get("images_by_camera", {})
         expected = list(self._ensure_expected_cameras())
         missing = [cam for cam in expected if cam not in images_by_camera]
@@ -53,7 +53,8 @@ class DashboardShotManager(ShotManager):
 
 class DashboardShotStore:
     def __init__(self, config_path: Path | None = None, *, root_path: Path | None = None):
-        self.gui_queue: queue.Queue[str] = queue.Queue()
+        # Written by the manager threads, drained by poll_gui_queue
+        self.gui_queue: queue.SimpleQueue[str] = queue.SimpleQueue()
         self.current_config = self._load_config(config_path)
         self.shot_manager: DashboardShotManager | None = None
         self.manual_params_manager = ManualParamsManager(
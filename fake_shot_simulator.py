@@ -24,7 +24,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 
 
 # ==========================
@@ -442,7 +442,15 @@ class SimulatorGUI:
         self.root = root
         self.sim = simulator
 
+        # Camera dialogs are built once and withdrawn on close
+        self._camera_cfg_win: tk.Toplevel | None = None
+        self._camera_cfg_reload = None
+        self._camera_edit_win: tk.Toplevel | None = None
+        self._camera_edit_load = None
+
         root.title("Fake ShotLog Simulator")
+        # Keep the window hidden while widgets are created so geometry is computed once
+        root.withdraw()
 
         # Chemins et configuration
         self.sim_root_var = tk.StringVar(value=str(self.sim.sim_root) if self.sim.sim_root else "")
@@ -538,6 +546,9 @@ class SimulatorGUI:
         btn_quit = tk.Button(frm_btn, text="Quit", command=root.quit)
         btn_quit.grid(row=0, column=2, padx=5)
 
+        root.update_idletasks()
+        root.deiconify()
+
     def _format_paths_text(self) -> str:
         return (
             f"RAW folder  : {self.sim.raw_root}\n"
@@ -635,46 +646,62 @@ class SimulatorGUI:
         tk.Button(btn_frame, text="Cancel", command=on_cancel).grid(row=0, column=1, padx=5)
 
     def _open_camera_config(self):
+        if self._camera_cfg_win is not None and self._camera_cfg_win.winfo_exists():
+            # Still open: keep the changes not applied yet, just bring it forward
+            if self._camera_cfg_win.state() == "withdrawn":
+                self._camera_cfg_reload()
+                self._camera_cfg_win.deiconify()
+            self._camera_cfg_win.lift()
+            return
+
         top = tk.Toplevel(self.root)
+        top.withdraw()
         top.title("Configure cameras")
 
-        camera_configs = [
-            CameraConfig(
-                name=cam.name,
-                specs=[CameraFileSpec(keyword=s.keyword, ext=s.ext) for s in cam.specs],
-            )
-            for cam in self.sim.cameras
-        ]
+        camera_configs: list[CameraConfig] = []
 
         frm_list = tk.Frame(top)
         frm_list.pack(padx=10, pady=10, fill="both", expand=True)
 
         tk.Label(frm_list, text="Cameras:").pack(anchor="w")
-        listbox = tk.Listbox(frm_list, height=8)
-        listbox.pack(fill="both", expand=True)
+        tree = ttk.Treeview(frm_list, show="tree", height=8)
+        tree.pack(fill="both", expand=True)
 
-        def refresh_listbox():
-            listbox.delete(0, tk.END)
+        def refresh_tree():
+            tree.delete(*tree.get_children())
             for cam in camera_configs:
-                listbox.insert(tk.END, cam.name)
+                tree.insert("", "end", text=cam.name)
+
+        # Rows are updated one at a time so that editing a long list does not
+        # re-insert every camera.
+        def add_camera(new_cam: CameraConfig):
+            camera_configs.append(new_cam)
+            tree.insert("", "end", text=new_cam.name)
+
+        def update_camera(item: str, updated: CameraConfig):
+            if not tree.exists(item):
+                return
+            camera_configs[tree.index(item)] = updated
+            tree.item(item, text=updated.name)
+            tree.selection_set(item)
 
         def on_add():
-            self._edit_camera(top, None, lambda new_cam: (camera_configs.append(new_cam), refresh_listbox()))
+            self._edit_camera(top, None, add_camera)
 
         def on_edit():
-            sel = listbox.curselection()
+            sel = tree.selection()
             if not sel:
                 return
-            idx = sel[0]
-            self._edit_camera(top, camera_configs[idx], lambda updated: (camera_configs.__setitem__(idx, updated), refresh_listbox()))
+            item = sel[0]
+            self._edit_camera(top, camera_configs[tree.index(item)], lambda updated: update_camera(item, updated))
 
         def on_remove():
-            sel = listbox.curselection()
+            sel = tree.selection()
             if not sel:
                 return
-            idx = sel[0]
-            camera_configs.pop(idx)
-            refresh_listbox()
+            item = sel[0]
+            camera_configs.pop(tree.index(item))
+            tree.delete(item)
 
         btn_frame = tk.Frame(top)
         btn_frame.pack(padx=10, pady=5, anchor="w")
@@ -683,36 +710,75 @@ class SimulatorGUI:
         tk.Button(btn_frame, text="Edit", command=on_edit).grid(row=0, column=1, padx=5)
         tk.Button(btn_frame, text="Remove", command=on_remove).grid(row=0, column=2, padx=5)
 
+        def reload():
+            camera_configs[:] = [
+                CameraConfig(
+                    name=cam.name,
+                    specs=[CameraFileSpec(keyword=s.keyword, ext=s.ext) for s in cam.specs],
+                )
+                for cam in self.sim.cameras
+            ]
+            refresh_tree()
+
         def on_close():
-            self.sim.set_cameras(camera_configs)
+            self.sim.set_cameras(list(camera_configs))
             self._refresh_camera_label()
-            top.destroy()
+            if self._camera_edit_win is not None and self._camera_edit_win.winfo_exists():
+                self._camera_edit_win.withdraw()
+            top.withdraw()
 
         tk.Button(top, text="Close", command=on_close).pack(pady=10)
 
         top.protocol("WM_DELETE_WINDOW", on_close)
 
-        refresh_listbox()
+        self._camera_cfg_win = top
+        self._camera_cfg_reload = reload
+        reload()
+
+        top.update_idletasks()
+        top.deiconify()
 
     def _edit_camera(self, parent, camera: CameraConfig | None, on_save):
+        if self._camera_edit_win is not None and self._camera_edit_win.winfo_exists():
+            # Still open: keep the fields being edited, just bring it forward
+            if self._camera_edit_win.state() == "withdrawn":
+                self._camera_edit_load(camera, on_save)
+                self._camera_edit_win.deiconify()
+            self._camera_edit_win.lift()
+            return
+
         top = tk.Toplevel(parent)
-        top.title("Edit camera" if camera else "Add camera")
 
         tk.Label(top, text="Camera name:").grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-        name_var = tk.StringVar(value=camera.name if camera else "")
+        name_var = tk.StringVar()
         entry_name = tk.Entry(top, textvariable=name_var, width=30)
         entry_name.grid(row=0, column=1, padx=10, pady=(10, 5))
 
-        specs = [CameraFileSpec(keyword=s.keyword, ext=s.ext) for s in (camera.specs if camera else [])]
+        specs: list[CameraFileSpec] = []
+        current = {"on_save": on_save}
 
         tk.Label(top, text="File specs:").grid(row=1, column=0, sticky="nw", padx=10, pady=(5, 5))
-        listbox = tk.Listbox(top, height=6)
-        listbox.grid(row=1, column=1, padx=10, pady=(5, 5), sticky="nsew")
+        spec_tree = ttk.Treeview(top, show="tree", height=6)
+        spec_tree.grid(row=1, column=1, padx=10, pady=(5, 5), sticky="nsew")
+
+        def spec_label(s: CameraFileSpec) -> str:
+            return f"keyword='{s.keyword}', ext='{s.ext}'"
 
         def refresh_specs():
-            listbox.delete(0, tk.END)
+            spec_tree.delete(*spec_tree.get_children())
             for s in specs:
-                listbox.insert(tk.END, f"keyword='{s.keyword}', ext='{s.ext}'")
+                spec_tree.insert("", "end", text=spec_label(s))
+
+        def add_spec(new_spec: CameraFileSpec):
+            specs.append(new_spec)
+            spec_tree.insert("", "end", text=spec_label(new_spec))
+
+        def update_spec(item: str, updated: CameraFileSpec):
+            if not spec_tree.exists(item):
+                return
+            specs[spec_tree.index(item)] = updated
+            spec_tree.item(item, text=spec_label(updated))
+            spec_tree.selection_set(item)
 
         def _edit_spec(spec: CameraFileSpec | None, on_spec_save):
             spec_win = tk.Toplevel(top)
@@ -734,22 +800,22 @@ class SimulatorGUI:
             tk.Button(spec_win, text="Cancel", command=spec_win.destroy).grid(row=2, column=1, padx=10, pady=10)
 
         def on_add_spec():
-            _edit_spec(None, lambda new_spec: (specs.append(new_spec), refresh_specs()))
+            _edit_spec(None, add_spec)
 
         def on_edit_spec():
-            sel = listbox.curselection()
+            sel = spec_tree.selection()
             if not sel:
                 return
-            idx = sel[0]
-            _edit_spec(specs[idx], lambda updated: (specs.__setitem__(idx, updated), refresh_specs()))
+            item = sel[0]
+            _edit_spec(specs[spec_tree.index(item)], lambda updated: update_spec(item, updated))
 
         def on_remove_spec():
-            sel = listbox.curselection()
+            sel = spec_tree.selection()
             if not sel:
                 return
-            idx = sel[0]
-            specs.pop(idx)
-            refresh_specs()
+            item = sel[0]
+            specs.pop(spec_tree.index(item))
+            spec_tree.delete(item)
 
         btn_spec = tk.Frame(top)
         btn_spec.grid(row=2, column=1, sticky="w", padx=10, pady=5)
@@ -757,16 +823,23 @@ class SimulatorGUI:
         tk.Button(btn_spec, text="Edit file", command=on_edit_spec).grid(row=0, column=1, padx=5)
         tk.Button(btn_spec, text="Remove file", command=on_remove_spec).grid(row=0, column=2, padx=5)
 
+        def load(camera: CameraConfig | None, on_save):
+            top.title("Edit camera" if camera else "Add camera")
+            name_var.set(camera.name if camera else "")
+            specs[:] = [CameraFileSpec(keyword=s.keyword, ext=s.ext) for s in (camera.specs if camera else [])]
+            current["on_save"] = on_save
+            refresh_specs()
+
         def on_ok():
             name = name_var.get().strip()
             if not name:
                 messagebox.showerror("Error", "Camera name cannot be empty.")
                 return
-            on_save(CameraConfig(name=name, specs=list(specs)))
-            top.destroy()
+            current["on_save"](CameraConfig(name=name, specs=list(specs)))
+            top.withdraw()
 
         def on_cancel():
-            top.destroy()
+            top.withdraw()
 
         btn_ok_cancel = tk.Frame(top)
         btn_ok_cancel.grid(row=3, column=1, sticky="e", padx=10, pady=10)
@@ -774,7 +847,11 @@ class SimulatorGUI:
         tk.Button(btn_ok_cancel, text="Cancel", command=on_cancel).grid(row=0, column=1, padx=5)
 
         top.columnconfigure(1, weight=1)
-        refresh_specs()
+        top.protocol("WM_DELETE_WINDOW", on_cancel)
+
+        self._camera_edit_win = top
+        self._camera_edit_load = load
+        load(camera, on_save)
 
     def _save_config(self):
         path = filedialog.asksaveasfilename(
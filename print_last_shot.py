@@ -3,46 +3,56 @@ import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-
 # -------------------------
 # Config
 # -------------------------
 FONT_SIZE = 150
 WINDOW_SIZE = "1500x300"
+POLL_INTERVAL_MS = 500  # how often the log is checked for new lines
 # -------------------------
 
 
+TAIL_CHUNK_SIZE = 64 * 1024
+
+_RE_NEW = re.compile(r"New shot detected:.*shot=(\d+)")
+_RE_SHOT = re.compile(r"Shot\s+(\d+)\s+\(")
+
+
+def match_shot_line(line):
+    """Return the shot number mentioned in a log line, or None."""
+    m = _RE_NEW.search(line)
+    if m:
+        return int(m.group(1))
+    m = _RE_SHOT.search(line)
+    if m:
+        return int(m.group(1))
+    return None
+
+
 def get_last_shot_number(path):
-    last_num = None
-    re_new = re.compile(r"New shot detected:.*shot=(\d+)")
-    re_shot = re.compile(r"Shot\s+(\d+)\s+\(")
+    """Return the last shot number mentioned in the log, scanning from the end.
 
+    The file is read backwards in chunks and the scan stops at the last line
+    mentioning a shot, so the cost does not grow with the size of the log.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                m = re_new.search(line)
-                if m:
-                    last_num = int(m.group(1))
-                    continue
-                m = re_shot.search(line)
-                if m:
-                    last_num = int(m.group(1))
+        with open(path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            partial = b""
+            while pos > 0:
+                size = min(TAIL_CHUNK_SIZE, pos)
+                pos -= size
+                f.seek(pos)
+                lines = (f.read(size) + partial).split(b"\n")
+                # The first piece may be the end of a line starting in the previous chunk
+                partial = lines.pop(0) if pos > 0 else b""
+                for raw in reversed(lines):
+                    num = match_shot_line(raw.decode("utf-8", errors="replace"))
+                    if num is not None:
+                        return num
     except Exception:
         return None
-    return last_num
-
-
-class LogFileEventHandler(FileSystemEventHandler):
-    def __init__(self, gui, path):
-        super().__init__()
-        self.gui = gui
-        self.path = os.path.abspath(path)
-
-    def on_modified(self, event):
-        if os.path.abspath(event.src_path) == self.path:
-            self.gui.root.after(0, self.gui.update_last_shot_from_watcher)
+    return None
 
 
 class SimpleLogWatcherGUI:
@@ -51,7 +61,11 @@ class SimpleLogWatcherGUI:
         self.root.title("Simple Shot Watcher")
 
         self.current_log_path = None
-        self.observer = None
+        self._poll_job = None
+        self._last_pos = 0
+        self._last_mtime = 0
+        self._last_num = None
+        self._partial = b""
 
         self._build_gui()
 
@@ -78,11 +92,15 @@ class SimpleLogWatcherGUI:
         frame.columnconfigure(1, weight=1)
 
     def load_log(self):
+        # Stop polling while the dialog is open so the main loop stays free
+        # to pump the native dialog.
+        self.stop_watching()
         path = filedialog.askopenfilename(
             title="Select a log file",
             filetypes=[("Text files", "*.txt;*.log"), ("All files", "*.*")]
         )
         if not path:
+            self.start_watching()
             return
 
         self.current_log_path = path
@@ -91,34 +109,81 @@ class SimpleLogWatcherGUI:
         self.start_watching()
 
     def update_last_shot(self):
+        """Full rescan: read the last shot from the tail and reset the read offset."""
         if not self.current_log_path:
             return
-        num = get_last_shot_number(self.current_log_path)
-        if num is None:
+        try:
+            st = os.stat(self.current_log_path)
+            self._last_pos = st.st_size
+            self._last_mtime = st.st_mtime
+        except OSError:
+            self._last_pos = 0
+            self._last_mtime = 0
+        self._partial = b""
+        self._last_num = get_last_shot_number(self.current_log_path)
+        self._show_last_shot()
+
+    def _show_last_shot(self):
+        if self._last_num is None:
             self.lbl_last_shot.configure(text="Last shot: -")
         else:
-            self.lbl_last_shot.configure(text=f"Last shot: {num}")
+            self.lbl_last_shot.configure(text=f"Last shot: {self._last_num}")
 
-    def update_last_shot_from_watcher(self):
-        self.update_last_shot()
+    def _poll(self):
+        self._poll_job = None
+        if not self.current_log_path:
+            return
+        try:
+            st = os.stat(self.current_log_path)
+        except OSError:
+            self._schedule_poll()
+            return
+
+        if st.st_size < self._last_pos:
+            # Truncated or replaced: start over from the tail
+            self.update_last_shot()
+        elif st.st_size > self._last_pos or st.st_mtime != self._last_mtime:
+            self._read_new_lines()
+            self._last_mtime = st.st_mtime
+        self._schedule_poll()
+
+    def _read_new_lines(self):
+        """Scan only the bytes appended since the last read."""
+        try:
+            with open(self.current_log_path, "rb") as f:
+                f.seek(self._last_pos)
+                data = f.read()
+                self._last_pos = f.tell()
+        except OSError:
+            return
+        if not data:
+            return
+
+        lines = (self._partial + data).split(b"\n")
+        # The last piece is an incomplete line until its newline is written
+        self._partial = lines.pop()
+        num = None
+        for raw in lines:
+            found = match_shot_line(raw.decode("utf-8", errors="replace"))
+            if found is not None:
+                num = found
+        if num is not None and num != self._last_num:
+            self._last_num = num
+            self._show_last_shot()
+
+    def _schedule_poll(self):
+        self._poll_job = self.root.after(POLL_INTERVAL_MS, self._poll)
 
     def start_watching(self):
         self.stop_watching()
         if not self.current_log_path:
             return
-
-        directory = os.path.dirname(self.current_log_path) or "."
-        handler = LogFileEventHandler(self, self.current_log_path)
-        observer = Observer()
-        observer.schedule(handler, directory, recursive=False)
-        observer.daemon = True
-        observer.start()
-        self.observer = observer
+        self._schedule_poll()
 
     def stop_watching(self):
-        if self.observer is not None:
-            self.observer.stop()
-            self.observer = None
+        if self._poll_job is not None:
+            self.root.after_cancel(self._poll_job)
+            self._poll_job = None
 
     def on_close(self):
         self.stop_watching()
@@ -1,6 +1,25 @@
-from .app import main
-from .gui import ShotManagerGUI
-from .manager import ShotManager
-from .config import ShotLogConfig
+from importlib import import_module
 
 __all__ = ["main", "ShotManagerGUI", "ShotManager", "ShotLogConfig"]
+
+# Resolved on first access so that importing a submodule (e.g. shot_log.config
+# from the dashboard) does not pull in tkinter and watchdog.
+_LAZY_ATTRS = {
+    "main": ".app",
+    "ShotManagerGUI": ".gui",
+    "ShotManager": ".manager",
+    "ShotLogConfig": ".config",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,6 +12,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List
 
+# Shortest RAW poll period accepted: watchdog's PollingObserver spins on 0
+MIN_POLL_INTERVAL_S = 0.1
+
 
 @dataclass
 class ManualParam:
@@ -74,7 +77,7 @@ class FolderFileSpec:
 
     @property
     def normalized_extensions(self) -> List[str]:
-        return [_normalize_extension(ext) for ext in self.extensions if _normalize_extension(ext)]
+        return [norm for ext in self.extensions if (norm := _normalize_extension(ext))]
 
     @property
     def normalized_extension(self) -> str:
@@ -99,7 +102,7 @@ class FolderFileSpec:
         extensions = self.normalized_extensions
         if not extensions:
             return True
-        return any(filename_lower.endswith(ext) for ext in extensions)
+        return filename_lower.endswith(tuple(extensions))
 
     def to_dict(self) -> dict:
         extensions = self.normalized_extensions
@@ -165,7 +168,16 @@ class ShotLogConfig:
     apply_global_keyword_to_all: bool = False
     test_keywords: List[str] = field(default_factory=lambda: ["test", "align"])
     state_file: str = "shot_log_state.json"
+    # check_interval_s paces the shot timeout loop; poll_interval_s is the RAW
+    # scan period and only matters when the PollingObserver fallback is used.
     check_interval_s: float = 0.5
+    poll_interval_s: float = 5.0
+    # Poll even on a local RAW root (e.g. folders filled by a sync client)
+    force_polling: bool = False
+    # Lines kept in the GUI console; older lines are dropped (0 = unlimited)
+    log_max_lines: int = 5000
+    # RAW files remembered for duplicate detection; least recently seen are forgotten (0 = unlimited)
+    processed_files_cap: int = 100_000
     motor_initial_csv: str = ""
     motor_history_csv: str = ""
     motor_positions_output: str = "motor_positions_by_shot.csv"
@@ -194,6 +206,10 @@ class ShotLogConfig:
             "state_file": self.state_file,
             "log_dir": self.rename_log_folder_suffix,
             "check_interval_s": self.check_interval_s,
+            "poll_interval_s": self.poll_interval_s,
+            "force_polling": self.force_polling,
+            "log_max_lines": self.log_max_lines,
+            "processed_files_cap": self.processed_files_cap,
             "motor_initial_csv": self.motor_initial_csv,
             "motor_history_csv": self.motor_history_csv,
             "motor_positions_output": self.motor_positions_output,
@@ -257,6 +273,10 @@ class ShotLogConfig:
             test_keywords=list(data.get("test_keywords", ["test", "align"])),
             state_file=data.get("state_file", "shot_log_state.json"),
             check_interval_s=float(data.get("check_interval_s", 0.5)),
+            poll_interval_s=max(MIN_POLL_INTERVAL_S, float(data.get("poll_interval_s", 5.0))),
+            force_polling=bool(data.get("force_polling", False)),
+            log_max_lines=int(data.get("log_max_lines", 5000)),
+            processed_files_cap=int(data.get("processed_files_cap", 100_000)),
             motor_initial_csv=data.get("motor_initial_csv", ""),
             motor_history_csv=data.get("motor_history_csv", ""),
             motor_positions_output=data.get("motor_positions_output", "motor_positions_by_shot.csv"),
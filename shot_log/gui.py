@@ -6,6 +6,7 @@ import logging
 import os
 import queue
 import re
+import threading
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
@@ -21,6 +22,13 @@ from .config import (
 from .manager import ShotManager
 from .manual_params import ManualParamsManager, build_empty_manual_values
 
+# Status refresh period while a shot is being acquired / otherwise
+STATUS_REFRESH_ACTIVE_MS = 250
+STATUS_REFRESH_IDLE_MS = 1000
+# Log console polling backs off from MIN to MAX while the queue stays empty
+LOG_POLL_MIN_MS = 100
+LOG_POLL_MAX_MS = 1000
+
 # ============================================================
 #  TKINTER GUI
 # ============================================================
@@ -32,8 +40,16 @@ class ShotManagerGUI:
 
         self.logger = logging.getLogger(__name__)
 
-        self.log_queue = queue.Queue()
+        # Filled by the manager threads, drained by _poll_log_queue
+        self.log_queue = queue.SimpleQueue()
+        self._log_poll_ms = LOG_POLL_MIN_MS
         self.manager = None
+        # Last options applied by _set_label, per label
+        self._label_options: dict[tk.Widget, dict] = {}
+        self._label_vars: dict[tk.Widget, tk.StringVar] = {}
+        # Last manager status shown and the label options built from it
+        self._last_status: dict | None = None
+        self._last_status_options: dict[tk.Widget, dict] = {}
 
         self.config = DEFAULT_CONFIG.clone()
         self.var_root = tk.StringVar(value=self.config.project_root or "")
@@ -44,6 +60,8 @@ class ShotManagerGUI:
         self.var_manual_date = tk.StringVar(value="")
         self.trigger_cam_vars = {}
         self.used_cam_vars = {}
+        self._trigger_popup: tk.Toplevel | None = None
+        self._used_popup: tk.Toplevel | None = None
         self.manual_param_vars: dict[str, tk.StringVar] = {}
         self.manual_entries: dict[str, ttk.Entry] = {}
         self.manual_confirm_labels: dict[str, ttk.Label] = {}
@@ -86,7 +104,7 @@ class ShotManagerGUI:
         self._reset_manual_state()
         self._apply_default_paths()
 
-        self.root.after(200, self._poll_log_queue)
+        self.root.after(self._log_poll_ms, self._poll_log_queue)
         self.root.after(500, self._update_status_labels)
 
     # ---------------------------
@@ -185,6 +203,11 @@ class ShotManagerGUI:
         self.var_timeout = tk.StringVar(value=str(self.config.timeout_s))
         ttk.Entry(frm_timing, textvariable=self.var_timeout, width=10).grid(row=1, column=1, padx=5)
 
+        ttk.Label(frm_timing, text="RAW poll interval (s):").grid(row=2, column=0, sticky="w")
+        self.var_poll_interval = tk.StringVar(value=str(self.config.poll_interval_s))
+        ttk.Entry(frm_timing, textvariable=self.var_poll_interval, width=10).grid(row=2, column=1, padx=5)
+        ttk.Label(frm_timing, text="(network drives only)").grid(row=2, column=2, sticky="w")
+
         ttk.Button(frm_timing, text="Apply timing", command=self._apply_timing) \
             .grid(row=0, column=2, rowspan=2, padx=10)
 
@@ -318,7 +341,8 @@ class ShotManagerGUI:
         ttk.Label(frm_next, text="Set next shot number:").grid(row=0, column=0, sticky="w")
         self.var_next_shot = tk.StringVar(value="")
         ttk.Entry(frm_next, textvariable=self.var_next_shot, width=10).grid(row=0, column=1, padx=5)
-        ttk.Button(frm_next, text="Set", command=self._set_next_shot).grid(row=0, column=2, padx=5)
+        self.btn_set_next = ttk.Button(frm_next, text="Set", command=self._set_next_shot)
+        self.btn_set_next.grid(row=0, column=2, padx=5)
 
         # Control buttons
         frm_ctrl = ttk.LabelFrame(self.content_frame, text="Control")
@@ -340,55 +364,40 @@ class ShotManagerGUI:
         frm_status = ttk.LabelFrame(self.content_frame, text="Status")
         frm_status.pack(fill="x", padx=5, pady=5)
 
-        ttk.Label(frm_status, text="System:").grid(row=0, column=0, sticky="w")
-        self.lbl_system = ttk.Label(frm_status, text="IDLE")
-        self.lbl_system.grid(row=0, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Open shots:").grid(row=1, column=0, sticky="w")
-        self.lbl_open = ttk.Label(frm_status, text="0")
-        self.lbl_open.grid(row=1, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Last shot index (by date):").grid(row=2, column=0, sticky="w")
-        self.lbl_last = ttk.Label(frm_status, text="-")
-        self.lbl_last.grid(row=2, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Next shot:").grid(row=3, column=0, sticky="w")
-        # Next shot value: same style as "Waiting next shot" (bold, blue)
-        self.lbl_next = tk.Label(
-            frm_status,
-            text="-",
-            font=("TkDefaultFont", 11, "bold"),
-            fg="blue"
-        )
-        self.lbl_next.grid(row=3, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Current keyword:").grid(row=4, column=0, sticky="w")
-        self.lbl_keyword = ttk.Label(frm_status, text=self.config.global_trigger_keyword)
-        self.lbl_keyword.grid(row=4, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Timing (s):").grid(row=5, column=0, sticky="w")
-        self.lbl_timing = ttk.Label(
-            frm_status,
-            text=f"window={self.config.full_window_s} / timeout={self.config.timeout_s}"
-        )
-        self.lbl_timing.grid(row=5, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Last shot status:").grid(row=6, column=0, sticky="w")
-        self.lbl_last_status = tk.Label(
-            frm_status,
-            text="No shot yet",
-            font=("TkDefaultFont", 11, "bold")
-        )
-        self.lbl_last_status.grid(row=6, column=1, sticky="w")
-
-        ttk.Label(frm_status, text="Current shot status:").grid(row=7, column=0, sticky="w")
-        self.lbl_current_status = tk.Label(
-            frm_status,
-            text="Waiting next shot",
-            font=("TkDefaultFont", 11, "bold"),
-            fg="blue"
+        # (caption, attribute suffix, initial text, options of a bold tk.Label or
+        # None for a plain ttk.Label). Each value label is stored as
+        # self.lbl_<suffix>; its text is set through a StringVar (see _set_label).
+        status_rows = (
+            ("System:", "system", "IDLE", None),
+            ("Open shots:", "open", "0", None),
+            ("Last shot index (by date):", "last", "-", None),
+            # Next shot value: same style as "Waiting next shot" (bold, blue)
+            ("Next shot:", "next", "-", {"fg": "blue"}),
+            ("Current keyword:", "keyword", self.config.global_trigger_keyword, None),
+            (
+                "Timing (s):",
+                "timing",
+                f"window={self.config.full_window_s} / timeout={self.config.timeout_s}",
+                None,
+            ),
+            ("Last shot status:", "last_status", "No shot yet", {}),
+            ("Current shot status:", "current_status", "Waiting next shot", {"fg": "blue"}),
         )
-        self.lbl_current_status.grid(row=7, column=1, sticky="w")
+        for row, (caption, name, initial, bold_options) in enumerate(status_rows):
+            ttk.Label(frm_status, text=caption).grid(row=row, column=0, sticky="w")
+            var = tk.StringVar(value=initial)
+            if bold_options is None:
+                lbl = ttk.Label(frm_status, textvariable=var)
+            else:
+                lbl = tk.Label(
+                    frm_status,
+                    textvariable=var,
+                    font=("TkDefaultFont", 11, "bold"),
+                    **bold_options,
+                )
+            lbl.grid(row=row, column=1, sticky="w")
+            setattr(self, f"lbl_{name}", lbl)
+            self._label_vars[lbl] = var
 
         # Logs
         frm_logs = ttk.LabelFrame(self.bottom_log_frame, text="Logs")
@@ -403,7 +412,10 @@ class ShotManagerGUI:
             command=self._toggle_console_visibility,
         ).pack(side="right")
 
-        self.txt_logs = scrolledtext.ScrolledText(frm_logs, wrap="word", height=20)
+        # Read-only console: no undo stack to record every insert/delete
+        self.txt_logs = scrolledtext.ScrolledText(
+            frm_logs, wrap="word", height=20, undo=False, maxundo=0, autoseparators=False
+        )
         self.txt_logs.pack(fill="both", expand=True, padx=5, pady=5)
         self.txt_logs.configure(state="disabled")
 
@@ -435,9 +447,43 @@ class ShotManagerGUI:
             return "All cameras"
         return ", ".join(used_cameras)
 
+    def _sync_camera_popup(self, top: tk.Toplevel | None, cam_vars: dict, flag: str) -> bool:
+        """
+        Reset the checkboxes of a camera selection popup to the current config.
+        Returns False when there is no popup, or it was destroyed because the
+        folder list changed and it has to be built again.
+        """
+        if top is None or not top.winfo_exists():
+            return False
+        if list(cam_vars) != self.config.folder_names:
+            top.destroy()
+            return False
+        for cam, var in cam_vars.items():
+            var.set(getattr(self.config.folders[cam], flag))
+        return True
+
+    def _reuse_camera_popup(self, top: tk.Toplevel | None, cam_vars: dict, flag: str) -> bool:
+        """
+        Show a camera selection popup built earlier (closing only withdraws it).
+        Returns False when it has to be built, e.g. after the folder list changed.
+        """
+        if top is None or not top.winfo_exists():
+            return False
+        if top.state() == "withdrawn":
+            # Start from the current config, not from the last unconfirmed clicks
+            if not self._sync_camera_popup(top, cam_vars, flag):
+                return False
+            top.deiconify()
+        top.lift()
+        return True
+
     def _open_trigger_list(self):
+        if self._reuse_camera_popup(self._trigger_popup, self.trigger_cam_vars, "trigger"):
+            return
         top = tk.Toplevel(self.root)
         top.title("Select Trigger Cameras")
+        top.protocol("WM_DELETE_WINDOW", top.withdraw)
+        self._trigger_popup = top
 
         self.trigger_cam_vars = {}
         folder_names = self.config.folder_names
@@ -456,13 +502,17 @@ class ShotManagerGUI:
             # If manager already running, apply immediately
             if self.manager:
                 self.manager.update_config(self.config.clone())
-            top.destroy()
+            top.withdraw()
 
         ttk.Button(top, text="OK", command=on_ok).grid(row=len(folder_names), column=0, pady=5)
 
     def _open_used_list(self):
+        if self._reuse_camera_popup(self._used_popup, self.used_cam_vars, "expected"):
+            return
         top = tk.Toplevel(self.root)
         top.title("Select Used Cameras (Expected)")
+        top.protocol("WM_DELETE_WINDOW", top.withdraw)
+        self._used_popup = top
 
         self.used_cam_vars = {}
         folder_names = self.config.folder_names
@@ -482,7 +532,7 @@ class ShotManagerGUI:
             # If manager already running, apply immediately
             if self.manager:
                 self.manager.update_expected_cameras(selected)
-            top.destroy()
+            top.withdraw()
 
         ttk.Button(top, text="OK", command=on_ok).grid(row=len(folder_names), column=0, pady=5)
 
@@ -717,8 +767,12 @@ class ShotManagerGUI:
         try:
             cfg.full_window_s = float(self.var_window.get() or cfg.full_window_s)
             cfg.timeout_s = float(self.var_timeout.get() or cfg.timeout_s)
+            cfg.poll_interval_s = float(self.var_poll_interval.get() or cfg.poll_interval_s)
         except ValueError:
-            messagebox.showerror("Error", "Full window and timeout must be numeric.")
+            messagebox.showerror("Error", "Full window, timeout and poll interval must be numeric.")
+        if cfg.poll_interval_s <= 0:
+            messagebox.showerror("Error", "Poll interval must be positive.")
+            cfg.poll_interval_s = self.config.poll_interval_s
         cfg.project_root = self.var_root.get().strip() or None
         cfg.raw_root_suffix = self.var_raw_folder.get().strip() or cfg.raw_root_suffix
         cfg.clean_root_suffix = self.var_clean_folder.get().strip() or cfg.clean_root_suffix
@@ -799,9 +853,9 @@ class ShotManagerGUI:
             clean_val = clean_path or (base_root / clean_name if base_root else None)
             log_val = log_path or (base_root / log_name if base_root else None)
 
-        self.lbl_raw_path.configure(text=str(raw_val) if raw_val else "-")
-        self.lbl_clean_path.configure(text=str(clean_val) if clean_val else "-")
-        self.lbl_log_path.configure(text=str(log_val) if log_val else "-")
+        self._set_label(self.lbl_raw_path, text=str(raw_val) if raw_val else "-")
+        self._set_label(self.lbl_clean_path, text=str(clean_val) if clean_val else "-")
+        self._set_label(self.lbl_log_path, text=str(log_val) if log_val else "-")
 
     def _apply_paths(self):
         base_root = self.var_root.get().strip()
@@ -862,17 +916,25 @@ class ShotManagerGUI:
         try:
             full_window = float(self.var_window.get())
             timeout = float(self.var_timeout.get())
+            poll_interval = float(self.var_poll_interval.get())
         except ValueError:
-            messagebox.showerror("Error", "Full window and timeout must be numeric.")
+            messagebox.showerror("Error", "Full window, timeout and poll interval must be numeric.")
+            return
+        if poll_interval <= 0:
+            messagebox.showerror("Error", "Poll interval must be positive.")
             return
 
         self.config.full_window_s = full_window
         self.config.timeout_s = timeout
+        self.config.poll_interval_s = poll_interval
 
         if apply_to_manager and self.manager:
-            self.manager.update_runtime_timing(full_window, timeout)
+            self.manager.update_runtime_timing(full_window, timeout, poll_interval)
         else:
-            self._append_log(f"[INFO] Timing will be used at start: window={full_window}s, timeout={timeout}s")
+            self._append_log(
+                f"[INFO] Timing will be used at start: window={full_window}s, timeout={timeout}s, "
+                f"poll_interval={poll_interval}s"
+            )
 
     def _apply_keyword(self, apply_only_if_manager=False):
         kw = self.var_global_kw.get()
@@ -880,7 +942,7 @@ class ShotManagerGUI:
             messagebox.showerror("Error", "Global keyword cannot be empty.")
             return
 
-        self.lbl_keyword.configure(text=kw)
+        self._set_label(self.lbl_keyword, text=kw)
         self.config.global_trigger_keyword = kw
         self.config.apply_global_keyword_to_all = self.var_apply_global_kw.get()
         if self.manager:
@@ -904,7 +966,37 @@ class ShotManagerGUI:
         if not self._ensure_manager():
             return
 
-        conflicts = self.manager.check_next_shot_conflicts(k)
+        # The conflict check scans the CLEAN folders (possibly on a network
+        # share): run it off the Tk thread and pick the result up with after()
+        manager = self.manager
+        result: dict = {}
+
+        def check():
+            try:
+                result["conflicts"] = manager.check_next_shot_conflicts(k)
+            except Exception as e:
+                result["error"] = e
+
+        worker = threading.Thread(target=check, name="NextShotCheck", daemon=True)
+        self.btn_set_next.configure(state="disabled")
+        worker.start()
+        self._finish_set_next_shot(worker, manager, k, result)
+
+    def _finish_set_next_shot(
+        self, worker: threading.Thread, manager: ShotManager, k: int, result: dict
+    ):
+        if worker.is_alive():
+            self.root.after(50, self._finish_set_next_shot, worker, manager, k, result)
+            return
+        self.btn_set_next.configure(state="normal")
+        if manager is not self.manager:
+            # Stopped or replaced while the check was running
+            return
+        if "error" in result:
+            messagebox.showerror("Error", f"Could not check existing shots: {result['error']}")
+            return
+
+        conflicts = result["conflicts"]
         if conflicts["same"] or conflicts["higher"]:
             msg_lines = []
             if conflicts["same"]:
@@ -916,11 +1008,14 @@ class ShotManagerGUI:
             if not messagebox.askyesno("Warning", "\n".join(msg_lines)):
                 return
 
-        self.manager.set_next_shot_number(k)
+        manager.set_next_shot_number(k)
 
     def _refresh_folder_labels(self):
         self.lbl_trigger_cams.configure(text=self._format_trigger_cams_label())
         self.lbl_used_cams.configure(text=self._format_used_cams_label())
+        # Popups left open would otherwise keep showing the previous config
+        self._sync_camera_popup(self._trigger_popup, self.trigger_cam_vars, "trigger")
+        self._sync_camera_popup(self._used_popup, self.used_cam_vars, "expected")
 
     def _open_folder_list(self):
         top = tk.Toplevel(self.root)
@@ -1514,6 +1609,7 @@ class ShotManagerGUI:
         self.var_log_folder.set(self.config.rename_log_folder_suffix)
         self.var_window.set(str(self.config.full_window_s))
         self.var_timeout.set(str(self.config.timeout_s))
+        self.var_poll_interval.set(str(self.config.poll_interval_s))
         self.var_global_kw.set(self.config.global_trigger_keyword)
         self.var_apply_global_kw.set(self.config.apply_global_keyword_to_all)
         self.var_motor_initial.set(self.config.motor_initial_csv)
@@ -1531,8 +1627,9 @@ class ShotManagerGUI:
         self._clear_manual_param_entries()
         self._reset_manual_state()
         self._refresh_folder_labels()
-        self.lbl_keyword.configure(text=self.config.global_trigger_keyword)
-        self.lbl_timing.configure(
+        self._set_label(self.lbl_keyword, text=self.config.global_trigger_keyword)
+        self._set_label(
+            self.lbl_timing,
             text=f"window={self.config.full_window_s} / timeout={self.config.timeout_s}"
         )
         self._reset_default_path_cache()
@@ -1544,24 +1641,34 @@ class ShotManagerGUI:
     # ---------------------------
 
     def _poll_log_queue(self):
-        updated = False
-        while True:
-            try:
-                line = self.log_queue.get_nowait()
-            except queue.Empty:
-                break
-            self._append_log(line)
-            updated = True
-
-        if updated:
-            self.txt_logs.see("end")
+        lines = []
+        try:
+            while True:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if lines:
+            max_lines = self.config.log_max_lines
+            if 0 < max_lines < len(lines):
+                # Lines the console cap would drop straight away
+                del lines[:-max_lines]
+            # One insert per tick instead of one per line
+            self._append_log("\n".join(lines))
+            if self.var_show_console.get():
+                self.txt_logs.see("end")
+            self._log_poll_ms = LOG_POLL_MIN_MS
+        else:
+            self._log_poll_ms = min(self._log_poll_ms * 2, LOG_POLL_MAX_MS)
 
-        self.root.after(200, self._poll_log_queue)
+        self.root.after(self._log_poll_ms, self._poll_log_queue)
 
     def _toggle_console_visibility(self):
         if self.var_show_console.get():
             if not self.txt_logs.winfo_ismapped():
                 self.txt_logs.pack(fill="both", expand=True, padx=5, pady=5)
+                # Lines added while hidden did not scroll the console
+                self.txt_logs.see("end")
         else:
             if self.txt_logs.winfo_ismapped():
                 self.txt_logs.pack_forget()
@@ -1569,13 +1676,90 @@ class ShotManagerGUI:
     def _append_log(self, text: str):
         self.txt_logs.configure(state="normal")
         self.txt_logs.insert("end", text + "\n")
+        max_lines = self.config.log_max_lines
+        if max_lines > 0:
+            # "end-1c" sits on the empty line after the trailing newline,
+            # so the widget holds end_line - 1 log lines
+            end_line = int(self.txt_logs.index("end-1c").split(".")[0])
+            if end_line - 1 > max_lines:
+                self.txt_logs.delete("1.0", f"{end_line - max_lines}.0")
         self.txt_logs.configure(state="disabled")
 
     # ---------------------------
     # STATUS UPDATE
     # ---------------------------
 
+    def _set_label(self, label: tk.Widget, **options):
+        # configure() queues a redraw even when nothing changed
+        if self._label_options.get(label) == options:
+            return
+        self._label_options[label] = options
+        var = self._label_vars.get(label)
+        if var is not None and "text" in options:
+            options = dict(options)
+            var.set(options.pop("text"))
+        if options:
+            label.configure(**options)
+
+    def _status_label_options(self, st: dict) -> dict[tk.Widget, dict]:
+        options: dict[tk.Widget, dict] = {
+            self.lbl_system: {"text": st["system_status"]},
+            self.lbl_open: {"text": str(st["open_shots_count"])},
+        }
+
+        # Last shot index by date
+        if st["last_shot_date"] and st["last_shot_index"]:
+            options[self.lbl_last] = {
+                "text": f"{st['last_shot_date']} / shot {st['last_shot_index']:03d}"
+            }
+        else:
+            options[self.lbl_last] = {"text": "-"}
+
+        # Next shot number (blue, bold)
+        options[self.lbl_next] = {"text": f"{st['next_shot_number']:03d}", "fg": "blue"}
+
+        # Last shot status
+        last_state = st["last_shot_state"]
+        if last_state is None:
+            txt_last = "No shot yet"
+            color_last = "black"
+        elif last_state == "acquired_ok":
+            txt_last = "Acquired – all cameras present"
+            color_last = "green"
+        elif last_state == "acquired_missing":
+            missing = st["last_shot_missing"]
+            txt_last = "Acquired – missing: " + (", ".join(missing) if missing else "unknown")
+            color_last = "red"
+        elif last_state == "acquiring":
+            waiting = st["last_shot_waiting_for"]
+            txt_last = "Acquiring – waiting for: " + (", ".join(waiting) if waiting else "none")
+            color_last = "orange"
+        else:
+            txt_last = "No shot yet"
+            color_last = "black"
+
+        options[self.lbl_last_status] = {"text": txt_last, "fg": color_last}
+
+        # Current shot status
+        if st["current_shot_state"] == "acquiring":
+            waiting = st["current_shot_waiting_for"]
+            txt_cur = "Acquiring – waiting for: " + (", ".join(waiting) if waiting else "none")
+            color_cur = "orange"
+        else:
+            txt_cur = "Waiting next shot"
+            color_cur = "blue"
+
+        options[self.lbl_current_status] = {"text": txt_cur, "fg": color_cur}
+
+        # Keyword & timing
+        options[self.lbl_keyword] = {"text": st["current_keyword"]}
+        options[self.lbl_timing] = {
+            "text": f"window={st['full_window']} / timeout={st['timeout']}"
+        }
+        return options
+
     def _update_status_labels(self):
+        delay_ms = STATUS_REFRESH_IDLE_MS
         if self.manager:
             st = self.manager.get_status()
             self._update_path_labels()
@@ -1587,74 +1771,31 @@ class ShotManagerGUI:
             elif not st.get("manual_date_str") and self.var_date_mode.get() != "auto":
                 self.var_date_mode.set("auto")
                 self._update_date_mode_label()
-            self.lbl_system.configure(text=st["system_status"])
-            self.lbl_open.configure(text=str(st["open_shots_count"]))
-
-            # Last shot index by date
-            if st["last_shot_date"] and st["last_shot_index"]:
-                self.lbl_last.configure(
-                    text=f"{st['last_shot_date']} / shot {st['last_shot_index']:03d}"
-                )
-            else:
-                self.lbl_last.configure(text="-")
-
-            # Next shot number (blue, bold)
-            self.lbl_next.configure(text=f"{st['next_shot_number']:03d}", fg="blue")
-
-            # Last shot status
-            last_state = st["last_shot_state"]
-            if last_state is None:
-                txt_last = "No shot yet"
-                color_last = "black"
-            elif last_state == "acquired_ok":
-                txt_last = "Acquired – all cameras present"
-                color_last = "green"
-            elif last_state == "acquired_missing":
-                missing = st["last_shot_missing"]
-                txt_last = "Acquired – missing: " + (", ".join(missing) if missing else "unknown")
-                color_last = "red"
-            elif last_state == "acquiring":
-                waiting = st["last_shot_waiting_for"]
-                txt_last = "Acquiring – waiting for: " + (", ".join(waiting) if waiting else "none")
-                color_last = "orange"
-            else:
-                txt_last = "No shot yet"
-                color_last = "black"
-
-            self.lbl_last_status.configure(text=txt_last, fg=color_last)
-
-            # Current shot status
-            cur_state = st["current_shot_state"]
-            if cur_state == "acquiring":
-                waiting = st["current_shot_waiting_for"]
-                txt_cur = "Acquiring – waiting for: " + (", ".join(waiting) if waiting else "none")
-                color_cur = "orange"
-            else:
-                txt_cur = "Waiting next shot"
-                color_cur = "blue"
-
-            self.lbl_current_status.configure(text=txt_cur, fg=color_cur)
-
-            # Keyword & timing
-            self.lbl_keyword.configure(text=st["current_keyword"])
-            self.lbl_timing.configure(
-                text=f"window={st['full_window']} / timeout={st['timeout']}"
-            )
+            # The label texts only need formatting again when the status changed
+            if st != self._last_status:
+                self._last_status = st
+                self._last_status_options = self._status_label_options(st)
+            for label, options in self._last_status_options.items():
+                self._set_label(label, **options)
+            if st["current_shot_state"] == "acquiring":
+                delay_ms = STATUS_REFRESH_ACTIVE_MS
         else:
             self._update_path_labels()
-            self.lbl_system.configure(text="IDLE")
-            self.lbl_open.configure(text="0")
-            self.lbl_last.configure(text="-")
-            self.lbl_next.configure(text="-", fg="blue")
-            self.lbl_last_status.configure(text="No shot yet", fg="black")
-            self.lbl_current_status.configure(text="Waiting next shot", fg="blue")
-            self.lbl_keyword.configure(text=self.config.global_trigger_keyword)
-            self.lbl_timing.configure(
+            self._set_label(self.lbl_system, text="IDLE")
+            self._set_label(self.lbl_open, text="0")
+            self._set_label(self.lbl_last, text="-")
+            self._set_label(self.lbl_next, text="-", fg="blue")
+            self._set_label(self.lbl_last_status, text="No shot yet", fg="black")
+            self._set_label(self.lbl_current_status, text="Waiting next shot", fg="blue")
+            self._set_label(self.lbl_keyword, text=self.config.global_trigger_keyword)
+            self._set_label(
+                self.lbl_timing,
                 text=f"window={self.config.full_window_s} / timeout={self.config.timeout_s}"
             )
             self._reset_manual_state()
+            self._last_status = None
 
-        self.root.after(500, self._update_status_labels)
+        self.root.after(delay_ms, self._update_status_labels)
 
 
 # ============================================================
@@ -1,24 +1,61 @@
 """Logging helpers for ShotLog."""
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 
 
 def create_logger(log_dir: Path, name: str) -> logging.Logger:
+    """
+    Return a logger writing to a timestamped file in ``log_dir`` and to stdout.
+
+    The logger only holds a QueueHandler: records are formatted and written by
+    a QueueListener thread, so callers never block on file or console I/O.
+    """
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"eli50069_log_{ts}.txt"
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
 
-    fh = logging.FileHandler(log_file, encoding="utf-8")
+    fh = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-    logger.addHandler(fh)
 
     sh = logging.StreamHandler(sys.stdout)
     sh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
-    logger.addHandler(sh)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    qh = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, fh, sh, respect_handler_level=True)
+    qh.listener = listener
+    listener.start()
+    # Flush pending records on interpreter exit
+    atexit.register(listener.stop)
+
+    logger.addHandler(qh)
     return logger
+
+
+def close_logger(logger: logging.Logger):
+    """Detach and close the handlers of a logger built by :func:`create_logger`."""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        listener = getattr(handler, "listener", None)
+        if listener is not None:
+            atexit.unregister(listener.stop)
+            # Drains the queue before returning
+            listener.stop()
+            for target in listener.handlers:
+                try:
+                    target.close()
+                except Exception:
+                    pass
+        try:
+            handler.close()
+        except Exception:
+            pass
@@ -5,21 +5,94 @@ import json
 import os
 import queue
 import re
-import shutil
 import threading
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson  # optional, faster encoding of the state file
+except ImportError:
+    orjson = None
+
 from watchdog.events import FileSystemEventHandler
-from watchdog.observers.polling import PollingObserver
 
 from shot_log_reader import LogShotAnalyzer
 
-from .config import ManualParam, ShotLogConfig
-from .logging_utils import create_logger
+from .config import MIN_POLL_INTERVAL_S, ManualParam, ShotLogConfig
+from .logging_utils import close_logger, create_logger
 from .motors import MotorStateManager, parse_initial_positions, parse_motor_history
-from .utils import ensure_dir, extract_shot_index_from_name, format_dt_for_name
+from .utils import (
+    atomic_write_bytes,
+    copy_file_fast,
+    ensure_dir,
+    extract_shot_index_from_name,
+    format_dt_for_name,
+    is_network_path,
+)
+
+
+# The state file is handled as raw bytes: both parsers read UTF-8 bytes
+# directly, so no text decoding layer is needed on either side.
+def _dumps_state(state: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(",", ":")).encode("utf-8")
+
+
+def _loads_state(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Queued RAW events above which a backlog warning is logged
+EVENT_BACKLOG_WARNING = 500
+# Hard cap on queued RAW events: past it, events are dropped and RAW is rescanned
+EVENT_QUEUE_LIMIT = 10_000
+# Settle delay after the first RAW event so the rest of a burst lands in the same batch
+EVENT_COALESCE_S = 0.05
+# Without close events, a RAW file is handled once its size and mtime held still this long
+RAW_SETTLE_S = 1.0
+# Events meaning the file is complete: closed after writing, or renamed into place
+_COMPLETE_EVENTS = frozenset({"CLOSED", "MOVED"})
+# Minimum delay between two state file writes (later saves replace the pending one)
+STATE_WRITE_INTERVAL_S = 1.0
+# Upper bound on parallel CLEAN copies when a shot is closed
+MAX_COPY_WORKERS = 8
+
+
+# RAW/<camera>/<YYYYMMDD>/...
+_DATE_DIR_RE = re.compile(r"\d{8}")
+
+
+def _list_clean_shots(cam_dir: str) -> list[tuple[int, float | None]]:
+    """
+    Return ``(shot_index, mtime)`` for the CLEAN files of one camera/date folder
+    (mtime is None if the file vanished meanwhile). os.scandir yields names
+    without building Path objects, and on Windows the listing carries the mtime.
+    """
+    shots = []
+    try:
+        it = os.scandir(cam_dir)
+    except OSError:
+        # Missing, not a folder or unreadable: like the glob this replaced,
+        # treat it as holding no shots
+        return shots
+    with it:
+        for entry in it:
+            idx = extract_shot_index_from_name(entry.name)
+            if idx is None:
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                mtime = None
+            shots.append((idx, mtime))
+    return shots
 
 
 # ============================================================
@@ -28,40 +101,46 @@ from .utils import ensure_dir, extract_shot_index_from_name, format_dt_for_name
 
 class RawFileEventHandler(FileSystemEventHandler):
     """
-    Watchdog handler: logs every filesystem event and notifies the ShotManager
-    when new or updated files appear under RAW root.
+    Watchdog handler: queues every filesystem event on files under RAW root
+    for the ShotManager event thread, which logs and processes them.
+    Nothing else happens on the observer thread so it can keep draining
+    filesystem events.
     """
 
     def __init__(self, manager):
         super().__init__()
         self.manager = manager
+        self.q = manager.event_queue
+        self.wake = manager.event_wake
 
-    # ---- helper interne pour log + dispatch ----
+    # ---- helper interne pour dispatch ----
     def _handle_path(self, label: str, path_str: str):
-        from pathlib import Path
-        p = Path(path_str)
-        exists = p.exists()
-
-        # Log clair côté ShotManager (pour la console de shot_log)
-        try:
-            self.manager._log(
-                "INFO",
-                f"[WATCHDOG {label}] event on file: {p} | exists={exists}"
-            )
-        except Exception as e:
-            # fallback minimal au cas où le logger n'est pas prêt
-            print(f"[WATCHDOG {label} DEBUG ERROR] {e} for path {p}")
-
-        # Passer au pipeline normal seulement si le fichier existe
-        if exists:
-            self.manager.handle_new_raw_file(path_str)
+        # deque.append is atomic; the event is only set (one lock) when the
+        # consumer is not already awake, so a burst costs no lock per file.
+        if len(self.q) >= EVENT_QUEUE_LIMIT:
+            # Flood: keep memory bounded, the event thread rescans RAW instead
+            self.manager.event_overflow = True
+        else:
+            self.q.append((label, path_str))
+        if not self.wake.is_set():
+            self.wake.set()
 
     # ---- events watchdog ----
     def on_created(self, event):
+        # Not handled right away (the file may still be written): the manager
+        # waits for its close event or for its size and mtime to settle.
+        # Still needed with close events, for files already present in a new
+        # folder, which only get a synthetic CREATED.
         if event.is_directory:
             return
         self._handle_path("CREATED", event.src_path)
 
+    def on_closed(self, event):
+        # inotify IN_CLOSE_WRITE: the file is fully written
+        if event.is_directory:
+            return
+        self._handle_path("CLOSED", event.src_path)
+
     def on_moved(self, event):
         if event.is_directory:
             return
@@ -74,7 +153,8 @@ class RawFileEventHandler(FileSystemEventHandler):
         la création d'un fichier peut apparaître comme une séquence de 'modified'.
         On route donc aussi ces events vers le manager.
         """
-        if event.is_directory:
+        # With close events, the CLOSED event follows the writes: skip the noise
+        if event.is_directory or self.manager.close_events:
             return
         self._handle_path("MODIFIED", event.src_path)
 
@@ -96,7 +176,7 @@ class ShotManager:
     """
 
     def __init__(
-        self, root_path: str, config: ShotLogConfig, gui_queue: queue.Queue, manual_date_str: str | None = None
+        self, root_path: str, config: ShotLogConfig, gui_queue: queue.SimpleQueue, manual_date_str: str | None = None
     ):
         self.config = config.clone()
         self.project_root = Path(self.config.project_root or root_path).resolve()
@@ -110,6 +190,10 @@ class ShotManager:
         self._default_manual_clean_root: Path | None = None
         self._default_motor_positions_path: Path | None = None
         self._default_motor_clean_root: Path | None = None
+        # (path, header, (mtime_ns, size)) of the motor positions CSV after our last write
+        self._motor_csv_written: tuple[Path, list[str], tuple[int, int]] | None = None
+        # Parsed shots per log file, reused while its (mtime_ns, size) is unchanged
+        self._parsed_logs_cache: dict[Path, tuple[tuple[int, int], list[dict]]] = {}
 
         self._apply_path_config()
         self.motor_state_manager: MotorStateManager | None = None
@@ -129,9 +213,41 @@ class ShotManager:
         self.running = False
         self.paused = False
         self.worker_thread = None
+        # Wakes the worker loop early (new shot, new timing, resume, stop)
+        self.worker_wake = threading.Event()
         self.observer = None
+        self._observer_polling = False
+        # True when the observer reports files closed after writing (inotify):
+        # RAW files are then handled on close only, otherwise once they settle
+        self.close_events = False
+        # (label, path) pushed by the watchdog handler, drained in batches by event_thread
+        self.event_queue: deque[tuple[str, str] | None] = deque()
+        self.event_wake = threading.Event()
+        # Set by the handler when events had to be dropped (queue full)
+        self.event_overflow = False
+        self.event_thread = None
+        self._event_backlog_warned = False
         self.lock = threading.Lock()
-        
+        # State file writes are handed to a background writer thread so that
+        # shot processing never waits on the disk. Only the latest snapshot
+        # is kept and writes are at least STATE_WRITE_INTERVAL_S apart, so a
+        # burst of saves results in a single write.
+        self._state_cond = threading.Condition()
+        self._state_pending: tuple[Path, bytes] | None = None
+        self._state_writing = False
+        self._state_urgent = False
+        self._state_last_write = 0.0
+        self._state_writer_thread: threading.Thread | None = None
+        # While False (before start() and after stop()) the writer thread exits
+        # once nothing is pending; _save_state starts a new one when needed
+        self._state_writer_keep_alive = False
+        self._last_saved_state: tuple[Path, bytes] | None = None
+        # Output folders already created, so per-shot writes skip the mkdir
+        self._ensured_dirs: set[Path] = set()
+        # Parallel CLEAN I/O: per-camera copies of a shot, network folder
+        # listings (created on first use)
+        self._copy_pool: ThreadPoolExecutor | None = None
+
         # Shots
         self.open_shots = []  # list of shot dicts
         self.last_shot_index_by_date = {}  # { "YYYYMMDD": last_index }
@@ -144,6 +260,8 @@ class ShotManager:
         # All files seen per date: { "YYYYMMDD": [info, info, ...] }
         # info = {"camera", "path", "dt", "date_str", "time_str"}
         self.files_by_date = {}
+        # Their "dt" values in the same order: { "YYYYMMDD": [dt, dt, ...] }
+        self.file_dts_by_date = {}
 
         # Files already assigned to some shot (by path)
         self.assigned_files = set()
@@ -195,12 +313,28 @@ class ShotManager:
         self.config.project_root = str(base_root)
         self.clean_root = base_root / self.config.clean_root_suffix
         self.log_dir = base_root / self.config.rename_log_folder_suffix
+        # RAW root as a string prefix, used to classify event paths without pathlib
+        self._raw_root_prefix = os.path.join(str(self.raw_root), "")
+        self._raw_root_prefix_norm = os.path.normcase(self._raw_root_prefix)
         self.state_file = self._resolve_state_file_path(self.config.state_file)
 
         if previous_clean_root and previous_clean_root != self.clean_root:
             self._reset_manual_default_path()
             self._reset_motor_default_path()
 
+    def _split_raw_path(self, path_str: str) -> list[str] | None:
+        """
+        Return the parts of ``path_str`` relative to RAW root
+        (``[camera, date, ..., filename]``), or None if it lies outside.
+        """
+        n = len(self._raw_root_prefix)
+        if os.path.normcase(path_str[:n]) != self._raw_root_prefix_norm:
+            return None
+        rest = path_str[n:]
+        if os.altsep:
+            rest = rest.replace(os.altsep, os.sep)
+        return [part for part in rest.split(os.sep) if part and part != "."]
+
     def _resolve_state_file_path(self, state_file_setting: str | Path | None) -> Path:
         """Return the absolute path for the state file under CLEAN by default."""
 
@@ -260,8 +394,19 @@ class ShotManager:
             )
         if log_prefix:
             self._log("INFO", f"{log_prefix}: {expected}")
+        self._refresh_config_caches(expected)
         return expected
 
+    def _refresh_config_caches(self, expected: list[str]):
+        """
+        Precompute the lookups used for every RAW file. Called whenever the
+        expected cameras are (re)established, i.e. on every config change.
+        """
+        self._expected_cameras = tuple(expected)
+        self._expected_set = frozenset(expected)
+        self._trigger_folders = frozenset(self.config.trigger_folders)
+        self._test_keywords = tuple(kw.lower() for kw in self.config.test_keywords)
+
     def _get_active_date_str(self) -> str:
         """
         Returns the date string YYYYMMDD used as 'current date' for:
@@ -292,6 +437,8 @@ class ShotManager:
     # ---------------------------
 
     def _setup_logging(self):
+        # One session log file per manager: the listener thread outlives
+        # stop()/start() and is only stopped at interpreter exit
         self.logger = create_logger(self.log_dir, f"ShotManager_{id(self)}")
 
     def _log(self, level: str, msg: str):
@@ -338,8 +485,7 @@ class ShotManager:
             source_path = self.state_file
 
         try:
-            with open(source_path, "r", encoding="utf-8") as f:
-                state = json.load(f)
+            state = _loads_state(Path(source_path).read_bytes())
 
             loaded_last_seen = state.get("last_seen_date_str")
             loaded_last_shot_index_by_date = state.get("last_shot_index_by_date", {})
@@ -379,7 +525,11 @@ class ShotManager:
         except Exception as e:
             self._log("ERROR", f"Failed to load state file: {e}")
 
-    def _save_state(self):
+    def _save_state(self, force: bool = False):
+        """
+        Queue a snapshot of the state for the writer thread. ``force`` skips
+        the write interval, for explicit checkpoints.
+        """
         state = {
             "last_shot_index_by_date": self.last_shot_index_by_date,
             "last_shot_trigger_time_by_date": {
@@ -392,11 +542,86 @@ class ShotManager:
             "last_seen_date_str": self.last_seen_date_str,
         }
         try:
-            os.makedirs(self.state_file.parent, exist_ok=True)
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=2)
+            snapshot = (self.state_file, _dumps_state(state))
         except Exception as e:
             self._log("ERROR", f"Could not save state: {e}")
+            return
+
+        with self._state_cond:
+            # Skip the write when nothing changed since the last save
+            if snapshot == self._last_saved_state:
+                return
+            self._last_saved_state = snapshot
+            self._state_pending = snapshot
+            if force:
+                self._state_urgent = True
+            if self._state_writer_thread is None:
+                self._state_writer_thread = threading.Thread(target=self._state_writer_loop, daemon=True)
+                self._state_writer_thread.start()
+            self._state_cond.notify_all()
+
+    def _state_writer_loop(self):
+        while True:
+            with self._state_cond:
+                while self._state_pending is None:
+                    if not self._state_writer_keep_alive:
+                        self._state_writer_thread = None
+                        return
+                    self._state_cond.wait()
+                # Debounce: saves arriving meanwhile replace the pending snapshot
+                while not self._state_urgent:
+                    remaining = self._state_last_write + STATE_WRITE_INTERVAL_S - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._state_cond.wait(remaining)
+                target, payload = self._state_pending
+                self._state_pending = None
+                self._state_urgent = False
+                self._state_writing = True
+            try:
+                self._ensure_dir_once(target.parent)
+                atomic_write_bytes(target, payload)
+            except Exception as e:
+                self._log("ERROR", f"Could not save state: {e}")
+                with self._state_cond:
+                    # Let the next save retry even if the state is unchanged
+                    if self._last_saved_state == (target, payload):
+                        self._last_saved_state = None
+            finally:
+                with self._state_cond:
+                    self._state_writing = False
+                    self._state_last_write = time.monotonic()
+                    self._state_cond.notify_all()
+
+    def _flush_state(self, timeout: float = 5.0):
+        """Wait until the pending state snapshot, if any, is on disk."""
+        deadline = time.monotonic() + timeout
+        with self._state_cond:
+            if self._state_pending is not None:
+                self._state_urgent = True
+                self._state_cond.notify_all()
+            while self._state_pending is not None or self._state_writing:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._log("WARNING", "Timed out waiting for the state file to be written.")
+                    return
+                self._state_cond.wait(remaining)
+
+    def _stop_state_writer(self, timeout: float = 5.0):
+        """Let the writer thread exit once idle; a later save starts a new one."""
+        with self._state_cond:
+            self._state_writer_keep_alive = False
+            thread = self._state_writer_thread
+            self._state_cond.notify_all()
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def _ensure_dir_once(self, path: Path):
+        """ensure_dir() that only hits the filesystem the first time a folder is seen."""
+        if path in self._ensured_dirs:
+            return
+        ensure_dir(path)
+        self._ensured_dirs.add(path)
 
     # ---------------------------
     # MOTOR DATA HANDLING
@@ -464,7 +689,7 @@ class ShotManager:
             self._log("WARNING", "Motor positions output path is not configured.")
             return
 
-        ensure_dir(output_path.parent)
+        self._ensure_dir_once(output_path.parent)
         desired_motors = sorted(manager.motor_names)
         header_prefix = ["shot_number", "trigger_time"]
         existing_rows: list[dict[str, str]] = []
@@ -490,7 +715,22 @@ class ShotManager:
                 return txt
             return txt
 
-        if output_path.exists():
+        # If the file is exactly as we last wrote it (already normalized) and no
+        # motor column is missing, the new row is simply appended.
+        append_header: list[str] | None = None
+        written = self._motor_csv_written
+        self._motor_csv_written = None
+        if written is not None:
+            written_path, written_header, written_stat = written
+            if written_path == output_path and set(desired_motors).issubset(written_header[2:]):
+                try:
+                    st = output_path.stat()
+                except OSError:
+                    st = None
+                if st is not None and (st.st_mtime_ns, st.st_size) == written_stat:
+                    append_header = written_header
+
+        if append_header is None and output_path.exists():
             try:
                 with output_path.open("r", newline="", encoding="utf-8") as f:
                     reader = csv.DictReader(f)
@@ -502,7 +742,9 @@ class ShotManager:
         for row in existing_rows:
             row["trigger_time"] = _normalize_trigger_time(row.get("trigger_time"))
 
-        if existing_header and len(existing_header) >= 2:
+        if append_header is not None:
+            all_motors = append_header[2:]
+        elif existing_header and len(existing_header) >= 2:
             known_motors = existing_header[2:]
             all_motors = sorted(set(known_motors) | set(desired_motors))
         else:
@@ -520,11 +762,15 @@ class ShotManager:
 
         existing_rows.append(row)
 
+        mode = "w" if append_header is None else "a"
         try:
-            with output_path.open("w", newline="", encoding="utf-8") as f:
+            with output_path.open(mode, newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=header)
-                writer.writeheader()
+                if append_header is None:
+                    writer.writeheader()
                 writer.writerows(existing_rows)
+            st = output_path.stat()
+            self._motor_csv_written = (output_path, header, (st.st_mtime_ns, st.st_size))
             self._log(
                 "INFO",
                 f"Motor positions recorded for shot {shot.get('shot_index'):03d} -> {output_path}",
@@ -540,12 +786,26 @@ class ShotManager:
             self._log("WARNING", f"Log directory not found: {self.log_dir}")
             return []
 
+        cache = self._parsed_logs_cache
+        seen: set[Path] = set()
         for log_file in sorted(self.log_dir.glob("*.txt")):
             try:
-                shots = analyzer.parse_log_file(log_file)
-            except Exception as exc:
-                self._log("WARNING", f"Failed to parse log file {log_file}: {exc}")
+                st = log_file.stat()
+            except OSError:
                 continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            seen.add(log_file)
+            cached = cache.get(log_file)
+            if cached is not None and cached[0] == stamp:
+                shots = cached[1]
+            else:
+                try:
+                    shots = analyzer.parse_log_file(log_file)
+                except Exception as exc:
+                    cache.pop(log_file, None)
+                    self._log("WARNING", f"Failed to parse log file {log_file}: {exc}")
+                    continue
+                cache[log_file] = (stamp, shots)
             for shot in shots:
                 date = shot.get("date")
                 num = shot.get("shot_number")
@@ -558,6 +818,10 @@ class ShotManager:
                 ):
                     shots_by_key[key] = shot
 
+        # Forget log files that were removed
+        for log_file in cache.keys() - seen:
+            del cache[log_file]
+
         return [shots_by_key[k] for k in sorted(shots_by_key.keys())]
 
     def recompute_all_motor_positions(self):
@@ -623,24 +887,22 @@ class ShotManager:
         {shot_index: set(cameras_that_have_this_shot)}
         """
         per_shot_cams = {}
-        expected = self.config.expected_folders
+        expected = self._expected_cameras
         latest_mtime_by_shot: dict[int, float] = {}
 
-        for cam in expected:
-            cam_dir = self.clean_root / cam / date_str
-            if not cam_dir.exists():
-                continue
-            for f in cam_dir.glob("*"):
-                idx = extract_shot_index_from_name(f.name)
-                if idx is None:
-                    continue
+        clean_root = str(self.clean_root)
+        cam_dirs = [os.path.join(clean_root, cam, date_str) for cam in expected]
+        if len(cam_dirs) > 1 and is_network_path(self.clean_root):
+            # Each listing is a round trip to the server: list the cameras side by side
+            listings = self._get_copy_pool().map(_list_clean_shots, cam_dirs)
+        else:
+            listings = map(_list_clean_shots, cam_dirs)
+
+        for cam, shots in zip(expected, listings):
+            for idx, mtime in shots:
                 per_shot_cams.setdefault(idx, set()).add(cam)
-                try:
-                    latest = latest_mtime_by_shot.get(idx, 0.0)
-                    mtime = os.path.getmtime(f)
-                    latest_mtime_by_shot[idx] = max(latest, mtime)
-                except FileNotFoundError:
-                    continue
+                if mtime is not None:
+                    latest_mtime_by_shot[idx] = max(latest_mtime_by_shot.get(idx, 0.0), mtime)
 
         return per_shot_cams, latest_mtime_by_shot
 
@@ -665,7 +927,7 @@ class ShotManager:
 
         last_idx = max(per_shot_cams.keys())
         cams_present = per_shot_cams[last_idx]
-        missing = [c for c in self.config.expected_folders if c not in cams_present]
+        missing = [c for c in self._expected_cameras if c not in cams_present]
 
         trigger_time = None
         mtime_val = latest_mtime_by_shot.get(last_idx)
@@ -709,11 +971,17 @@ class ShotManager:
             self.running = True
             self.paused = False
             self.system_status = "RUNNING"
+        with self._state_cond:
+            self._state_writer_keep_alive = True
 
         # Start worker loop
         self.worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
         self.worker_thread.start()
 
+        # Start RAW event loop
+        self.event_thread = threading.Thread(target=self._event_loop, daemon=True)
+        self.event_thread.start()
+
         # Start watchdog observer
         self._start_observer()
 
@@ -725,12 +993,16 @@ class ShotManager:
 
         handler = RawFileEventHandler(self)
 
-        # PollingObserver everywhere (robust with cloud / network and no inotify limits)
-        self._log("INFO", "Using PollingObserver (cross-platform polling mode).")
-        self.observer = PollingObserver()
-
-        observer_type = type(self.observer).__name__
-        self._log("INFO", f"Observer type: {observer_type}")
+        # Native events (inotify / ReadDirectoryChangesW) cost nothing at idle.
+        # Network filesystems do not deliver them reliably: poll those instead.
+        if self.config.force_polling:
+            use_polling = True
+            self._log("INFO", "force_polling is set, using PollingObserver.")
+        else:
+            use_polling = is_network_path(self.raw_root)
+            if use_polling:
+                self._log("INFO", "RAW root is on a network filesystem, using PollingObserver.")
+        self.observer = self._create_observer(polling=use_polling)
 
         raw_root_resolved = self.raw_root.resolve()
         if not self.raw_root.exists():
@@ -745,12 +1017,48 @@ class ShotManager:
             self._log("INFO", "Starting watchdog observer.")
             self.observer.start()
             self._log("INFO", "Watchdog observer started on RAW root.")
+            return
         except OSError as e:
-            self._log("ERROR", f"Failed to start file system watcher: {e}")
-            with self.lock:
-                self.system_status = "ERROR"
-                self.running = False
-            self.observer = None
+            if use_polling:
+                self._log("ERROR", f"Failed to start file system watcher: {e}")
+            else:
+                # e.g. inotify watch limit reached on a large tree
+                self._log("WARNING", f"Native file system watcher failed ({e}), falling back to polling.")
+                self.observer = self._create_observer(polling=True)
+                self.observer.schedule(handler, str(self.raw_root), recursive=True)
+                try:
+                    self.observer.start()
+                    self._log("INFO", "Watchdog observer started on RAW root.")
+                    return
+                except OSError as e2:
+                    self._log("ERROR", f"Failed to start file system watcher: {e2}")
+
+        with self.lock:
+            self.system_status = "ERROR"
+            self.running = False
+        self.observer = None
+
+    def _create_observer(self, *, polling: bool):
+        # Imported here: the observer backends are only needed once watching starts
+        if polling:
+            from watchdog.observers.polling import PollingObserver
+
+            observer = PollingObserver(timeout=self.config.poll_interval_s)
+        else:
+            from watchdog.observers import Observer
+
+            observer = Observer()
+        self._observer_polling = polling
+        self.close_events = False
+        if not polling:
+            try:
+                from watchdog.observers.inotify import InotifyObserver
+            except Exception:  # not Linux
+                pass
+            else:
+                self.close_events = isinstance(observer, InotifyObserver)
+        self._log("INFO", f"Observer type: {type(observer).__name__}")
+        return observer
 
     def pause(self):
         with self.lock:
@@ -766,6 +1074,7 @@ class ShotManager:
                 return
             self.paused = False
             self.system_status = "RUNNING"
+        self.worker_wake.set()
         self._log("INFO", "ShotManager resumed.")
 
     def stop(self):
@@ -779,19 +1088,41 @@ class ShotManager:
             self.observer = None
 
         if self.worker_thread and self.worker_thread.is_alive():
+            self.worker_wake.set()
             self.worker_thread.join(timeout=5.0)
 
+        if self.event_thread and self.event_thread.is_alive():
+            self.event_queue.append(None)
+            self.event_wake.set()
+            self.event_thread.join(timeout=5.0)
+        self.event_thread = None
+
+        with self.lock:
+            pool, self._copy_pool = self._copy_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
         self._save_state()
+        self._flush_state()
+        self._stop_state_writer()
         self._log("INFO", "ShotManager stopped.")
 
-    def update_runtime_timing(self, full_window: float, timeout: float):
+    def update_runtime_timing(self, full_window: float, timeout: float, poll_interval: float | None = None):
         """
         Update full time window and timeout, and recompute shot windows
-        for shots that are still collecting.
+        for shots that are still collecting. A new poll interval restarts
+        the observer if it is currently polling.
         """
+        restart_observer = False
         with self.lock:
             self.config.full_window_s = full_window
             self.config.timeout_s = timeout
+            if poll_interval is not None:
+                # A zero period would make the polling observer spin
+                poll_interval = max(MIN_POLL_INTERVAL_S, poll_interval)
+                if poll_interval != self.config.poll_interval_s:
+                    self.config.poll_interval_s = poll_interval
+                    restart_observer = self.running and self.observer is not None and self._observer_polling
 
             half_window = full_window / 2.0
             for s in self.open_shots:
@@ -800,7 +1131,22 @@ class ShotManager:
                     s["window_start"] = ref - timedelta(seconds=half_window)
                     s["window_end"] = ref + timedelta(seconds=half_window)
 
-        self._log("INFO", f"Updated timing parameters: full_window={full_window}s, timeout={timeout}s")
+        self._log(
+            "INFO",
+            f"Updated timing parameters: full_window={full_window}s, timeout={timeout}s, "
+            f"poll_interval={self.config.poll_interval_s}s",
+        )
+        # Shot timeouts may have moved
+        self.worker_wake.set()
+        if restart_observer:
+            self._restart_observer()
+
+    def _restart_observer(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer.join(timeout=5.0)
+            self.observer = None
+        self._start_observer()
 
     def update_keyword_settings(self, global_keyword: str, apply_global_to_all: bool):
         with self.lock:
@@ -844,12 +1190,7 @@ class ShotManager:
         ensure_dir(self.log_dir)
 
         if previous_log_dir and previous_log_dir != self.log_dir:
-            for handler in list(self.logger.handlers):
-                self.logger.removeHandler(handler)
-                try:
-                    handler.close()
-                except Exception:
-                    pass
+            close_logger(self.logger)
             self._setup_logging()
 
         self._log(
@@ -862,11 +1203,7 @@ class ShotManager:
             self._log("WARNING", f"RAW root does not exist: {self.raw_root}")
 
         if self.running and previous_raw_root and previous_raw_root != self.raw_root:
-            if self.observer:
-                self.observer.stop()
-                self.observer.join(timeout=5.0)
-                self.observer = None
-            self._start_observer()
+            self._restart_observer()
         self.log_keyword_config()
 
     def set_manual_date(self, date_str: str | None):
@@ -893,7 +1230,7 @@ class ShotManager:
             date_str = self._get_active_date_str()
         with self.lock:
             self.last_shot_index_by_date[date_str] = k - 1
-        self._save_state()
+        self._save_state(force=True)
         self._log("INFO", f"Next shot for {date_str} set to {k:03d}")
 
     def check_next_shot_conflicts(self, proposed_k: int, date_str: str | None = None):
@@ -929,101 +1266,104 @@ class ShotManager:
     # ---------------------------
 
     def get_status(self):
+        # Only copy what the status needs while holding the lock; the GUI polls
+        # this continuously and file events wait on the same lock.
         with self.lock:
             active_date = self._get_active_date_str()
             open_count = len(self.open_shots)
             last_idx = self.last_shot_index_by_date.get(active_date)
-            last_date_idx = (active_date, last_idx) if last_idx is not None else None
-
-            def fmt(dt_obj):
-                return dt_obj.isoformat(sep=" ") if isinstance(dt_obj, datetime) else None
-
-            # Collecting shots sorted by (date_str, shot_index)
-            collecting = sorted(
-                [s for s in self.open_shots if s["status"] == "collecting"],
-                key=lambda s: (s["date_str"], s["shot_index"])
-            )
-
-            status = {
-                "system_status": self.system_status,
-                "open_shots_count": open_count,
-                "last_shot_date": last_date_idx[0] if last_date_idx else None,
-                "last_shot_index": last_date_idx[1] if last_date_idx else None,
-                "last_shot_trigger_time": None,
-                "next_shot_number": self.get_next_shot_number_today(),
-                "last_completed_shot_index": None,
-                "last_completed_shot_date": None,
-                "last_completed_trigger_time": None,
-                "active_date_str": active_date,
-                "manual_date_str": self.manual_date_str,
-
-                # Last shot panel
-                "last_shot_state": None,           # "acquiring" / "acquired_ok" / "acquired_missing" / None
-                "last_shot_waiting_for": [],
-                "last_shot_missing": [],
-                "last_shot_date_display": None,
-                "last_shot_index_display": None,
-
-                # Current shot panel
-                "current_shot_state": None,        # "waiting" / "acquiring"
-                "current_shot_waiting_for": [],
-                "current_shot_date": None,
-                "current_shot_index": None,
-                "current_shot_trigger_time": None,
-
-                # Timing
-                "full_window": self.config.full_window_s,
-                "timeout": self.config.timeout_s,
-                "current_keyword": self.config.global_trigger_keyword,
-            }
+            last_trigger_time = self._get_last_trigger_time_for_date(active_date)
+            # (date_str, shot_index, trigger_time, cameras present)
+            collecting = [
+                (s["date_str"], s["shot_index"], s.get("trigger_time"), frozenset(s["images_by_camera"]))
+                for s in self.open_shots
+                if s["status"] == "collecting"
+            ]
+            last_completed = dict(self.last_completed_shot) if self.last_completed_shot is not None else None
+            system_status = self.system_status
+            manual_date_str = self.manual_date_str
+            expected = self._expected_cameras
+            full_window = self.config.full_window_s
+            timeout = self.config.timeout_s
+            current_keyword = self.config.global_trigger_keyword
+
+        def fmt(dt_obj):
+            return dt_obj.isoformat(sep=" ") if isinstance(dt_obj, datetime) else None
+
+        # Collecting shots sorted by (date_str, shot_index)
+        collecting.sort(key=lambda c: (c[0], c[1]))
+
+        status = {
+            "system_status": system_status,
+            "open_shots_count": open_count,
+            "last_shot_date": active_date if last_idx is not None else None,
+            "last_shot_index": last_idx,
+            "last_shot_trigger_time": fmt(last_trigger_time),
+            "next_shot_number": (last_idx or 0) + 1,
+            "last_completed_shot_index": None,
+            "last_completed_shot_date": None,
+            "last_completed_trigger_time": None,
+            "active_date_str": active_date,
+            "manual_date_str": manual_date_str,
+
+            # Last shot panel
+            "last_shot_state": None,           # "acquiring" / "acquired_ok" / "acquired_missing" / None
+            "last_shot_waiting_for": [],
+            "last_shot_missing": [],
+            "last_shot_date_display": None,
+            "last_shot_index_display": None,
+
+            # Current shot panel
+            "current_shot_state": None,        # "waiting" / "acquiring"
+            "current_shot_waiting_for": [],
+            "current_shot_date": None,
+            "current_shot_index": None,
+            "current_shot_trigger_time": None,
+
+            # Timing
+            "full_window": full_window,
+            "timeout": timeout,
+            "current_keyword": current_keyword,
+        }
 
-            expected = self.config.expected_folders
-            status["last_shot_trigger_time"] = fmt(self._get_last_trigger_time_for_date(active_date))
-
-            # CURRENT SHOT: most recent collecting shot
-            if collecting:
-                cur = collecting[-1]
-                present = set(cur["images_by_camera"].keys())
-                waiting_for = [c for c in expected if c not in present]
-                status["current_shot_state"] = "acquiring"
-                status["current_shot_date"] = cur["date_str"]
-                status["current_shot_index"] = cur["shot_index"]
-                status["current_shot_trigger_time"] = fmt(cur.get("trigger_time"))
-                status["current_shot_waiting_for"] = waiting_for
-            else:
-                status["current_shot_state"] = "waiting"
-
-            # LAST SHOT PANEL:
-            # - If we have >=2 collecting shots: show the previous one as "acquiring".
-            # - Else, show last completed shot (ok/missing).
-            if len(collecting) >= 2:
-                prev = collecting[-2]
-                present = set(prev["images_by_camera"].keys())
-                waiting_for = [c for c in expected if c not in present]
-                status["last_shot_state"] = "acquiring"
-                status["last_shot_date_display"] = prev["date_str"]
-                status["last_shot_index_display"] = prev["shot_index"]
-                status["last_shot_waiting_for"] = waiting_for
-            elif self.last_completed_shot is not None:
-                s = self.last_completed_shot
-                missing = s["missing_cameras"]
-                status["last_shot_date_display"] = s["date_str"]
-                status["last_shot_index_display"] = s["shot_index"]
-                if missing:
-                    status["last_shot_state"] = "acquired_missing"
-                    status["last_shot_missing"] = list(missing)
-                else:
-                    status["last_shot_state"] = "acquired_ok"
+        # CURRENT SHOT: most recent collecting shot
+        if collecting:
+            cur_date, cur_idx, cur_trigger, present = collecting[-1]
+            status["current_shot_state"] = "acquiring"
+            status["current_shot_date"] = cur_date
+            status["current_shot_index"] = cur_idx
+            status["current_shot_trigger_time"] = fmt(cur_trigger)
+            status["current_shot_waiting_for"] = [c for c in expected if c not in present]
+        else:
+            status["current_shot_state"] = "waiting"
+
+        # LAST SHOT PANEL:
+        # - If we have >=2 collecting shots: show the previous one as "acquiring".
+        # - Else, show last completed shot (ok/missing).
+        if len(collecting) >= 2:
+            prev_date, prev_idx, _, present = collecting[-2]
+            status["last_shot_state"] = "acquiring"
+            status["last_shot_date_display"] = prev_date
+            status["last_shot_index_display"] = prev_idx
+            status["last_shot_waiting_for"] = [c for c in expected if c not in present]
+        elif last_completed is not None:
+            missing = last_completed["missing_cameras"]
+            status["last_shot_date_display"] = last_completed["date_str"]
+            status["last_shot_index_display"] = last_completed["shot_index"]
+            if missing:
+                status["last_shot_state"] = "acquired_missing"
+                status["last_shot_missing"] = list(missing)
             else:
-                status["last_shot_state"] = None
+                status["last_shot_state"] = "acquired_ok"
+        else:
+            status["last_shot_state"] = None
 
-            if self.last_completed_shot is not None:
-                status["last_completed_shot_index"] = self.last_completed_shot.get("shot_index")
-                status["last_completed_shot_date"] = self.last_completed_shot.get("date_str")
-                trig = self.last_completed_shot.get("trigger_time")
-                status["last_completed_trigger_time"] = fmt(trig)
+        if last_completed is not None:
+            status["last_completed_shot_index"] = last_completed.get("shot_index")
+            status["last_completed_shot_date"] = last_completed.get("date_str")
+            status["last_completed_trigger_time"] = fmt(last_completed.get("trigger_time"))
 
-            return status
+        return status
 
     # =======================================================
     #  WORKER LOOP
@@ -1032,88 +1372,267 @@ class ShotManager:
     def _worker_loop(self):
         self._log("INFO", "Worker loop started.")
         interval = self.config.check_interval_s
+        wake = self.worker_wake
 
         while True:
+            # Cleared before looking at the shots: a wake-up sent from here on
+            # makes the wait below return immediately.
+            wake.clear()
             with self.lock:
                 if not self.running:
                     break
                 paused = self.paused
 
+            delay = None
             if not paused:
                 try:
                     self._check_shot_timeouts()
+                    delay = self._next_timeout_delay()
                 except Exception as e:
                     self._log("ERROR", f"Exception in worker loop: {e}")
                     with self.lock:
                         self.system_status = "ERROR"
+                    delay = interval
 
-            time.sleep(interval)
+            # Sleep until the next shot timeout, never longer than
+            # check_interval_s while shots are open; with no open shot (or
+            # paused) there is nothing to time out, so just wait to be woken.
+            wake.wait(None if delay is None else min(delay, interval))
 
         self._log("INFO", "Worker loop terminated.")
 
+    def _event_loop(self):
+        """
+        Drain RAW events queued by the watchdog handler. Everything already
+        waiting is handled as one batch, so a burst of camera files costs a
+        single state save instead of one per file.
+
+        A file is only handed on once complete: on its CLOSED (inotify) or
+        MOVED event, otherwise once its size and mtime held still for
+        RAW_SETTLE_S, so a camera still writing it is never copied half-done.
+        """
+        events = self.event_queue
+        wake = self.event_wake
+        # Files still being written: path -> (size, mtime_ns, monotonic time of next check)
+        pending: dict[str, tuple[int, int, float]] = {}
+        while True:
+            if pending:
+                wake.wait(max(0.0, min(p[2] for p in pending.values()) - time.monotonic()))
+            else:
+                wake.wait()
+            if wake.is_set():
+                # A camera write usually fires several events per file:
+                # give the burst a moment so each file is handled once
+                time.sleep(EVENT_COALESCE_S)
+            # Clear before draining: anything appended from here on either
+            # gets drained below or sets the event again.
+            wake.clear()
+            overflow = self.event_overflow
+            if overflow:
+                self.event_overflow = False
+            items = []
+            stop = False
+            while events:
+                item = events.popleft()
+                if item is None:
+                    stop = True
+                    break
+                items.append(item)
+            if overflow:
+                self._log(
+                    "WARNING",
+                    f"RAW event queue full ({EVENT_QUEUE_LIMIT} events), events were dropped: rescanning RAW.",
+                )
+                # The rescan also covers the drained events
+                if not stop:
+                    self._rescan_raw_files()
+                items = []
+            if not items and not pending:
+                if stop:
+                    break
+                continue
+
+            backlog = len(items)
+            if backlog >= EVENT_BACKLOG_WARNING:
+                if not self._event_backlog_warned:
+                    self._log("WARNING", f"RAW event backlog: {backlog} events waiting to be processed.")
+                    self._event_backlog_warned = True
+            else:
+                self._event_backlog_warned = False
+
+            # One stat per file gives the existence check, the mtime and the
+            # size; repeated events for a file reuse it.
+            entries: dict[str, float] = {}
+            seen: dict[str, os.stat_result | None] = {}
+            stat = os.stat
+            now = time.monotonic()
+            for label, path_str in items:
+                if path_str in seen:
+                    st = seen[path_str]
+                else:
+                    try:
+                        st = stat(path_str)
+                    except OSError:
+                        st = None
+                    seen[path_str] = st
+                exists = st is not None
+                # Log clair côté ShotManager (pour la console de shot_log)
+                self._log("INFO", f"[WATCHDOG {label}] event on file: {path_str} | exists={exists}")
+                # Passer au pipeline normal seulement si le fichier existe
+                if not exists:
+                    pending.pop(path_str, None)
+                elif label in _COMPLETE_EVENTS:
+                    pending.pop(path_str, None)
+                    entries[path_str] = st.st_mtime
+                elif path_str not in entries:
+                    # Possibly still being written: check again after RAW_SETTLE_S
+                    pending[path_str] = (st.st_size, st.st_mtime_ns, now + RAW_SETTLE_S)
+
+            # Files whose size and mtime did not move for RAW_SETTLE_S are complete
+            for path_str, (size, mtime_ns, check_at) in list(pending.items()):
+                if check_at > now:
+                    continue
+                try:
+                    st = stat(path_str)
+                except OSError:
+                    del pending[path_str]
+                    continue
+                if st.st_size == size and st.st_mtime_ns == mtime_ns:
+                    del pending[path_str]
+                    entries[path_str] = st.st_mtime
+                else:
+                    pending[path_str] = (st.st_size, st.st_mtime_ns, now + RAW_SETTLE_S)
+
+            if entries:
+                try:
+                    self._handle_raw_entries(entries.items())
+                except Exception as e:
+                    self._log("ERROR", f"Exception while handling RAW files: {e}")
+                    with self.lock:
+                        self.system_status = "ERROR"
+            if stop:
+                # Files still settling are left out, like any event after stop()
+                break
+
+    def _rescan_raw_files(self):
+        """
+        Process every RAW file of the active date, oldest first. Used after an
+        event flood instead of the dropped events; files already handled are
+        skipped by the path + mtime deduplication.
+        """
+        date_str = self._get_active_date_str()
+        found = []
+        for cam in list(self.config.folders):
+            for dirpath, _dirnames, filenames in os.walk(os.path.join(self._raw_root_prefix, cam, date_str)):
+                for name in filenames:
+                    path_str = os.path.join(dirpath, name)
+                    try:
+                        found.append((os.path.getmtime(path_str), path_str))
+                    except OSError:
+                        continue
+        found.sort()
+        self._log("INFO", f"RAW rescan for {date_str}: {len(found)} files found.")
+        try:
+            self._handle_raw_entries((path_str, mtime) for mtime, path_str in found)
+        except Exception as e:
+            self._log("ERROR", f"Exception while handling RAW files: {e}")
+            with self.lock:
+                self.system_status = "ERROR"
+
     # =======================================================
     #  FILE HANDLING (watchdog)
     # =======================================================
 
     def handle_new_raw_file(self, path_str: str | Path):
+        self.handle_new_raw_files([path_str])
+
+    def handle_new_raw_files(self, paths: list[str | Path]):
+        """Process a batch of RAW files in arrival order and save the state once."""
+        entries: dict[str, float] = {}
+        getmtime = os.path.getmtime
+        # Repeated entries for the same file collapse to a single one.
+        # Paths stay plain strings: a Path per event is pure overhead here.
+        for path_str in dict.fromkeys(os.fspath(p) for p in paths):
+            try:
+                # NOTE: On Windows + cloud sync the filesystem creation time is unreliable.
+                # For all shot logic we always rely on the filesystem Modified Time (mtime).
+                entries[path_str] = getmtime(path_str)  # always use Modified time
+            except FileNotFoundError:
+                continue
+        self._handle_raw_entries(entries.items())
+
+    def _handle_raw_entries(self, entries):
+        """Process ``(path, mtime)`` pairs whose mtime is already known."""
         with self.lock:
             if not self.running or self.paused:
                 return
 
-        path = Path(path_str)
-
-        # \U0001f525 DEBUG : confirme que handle_new_raw_file est bien appelé
-        self._log("INFO", f"[MANAGER] Handling new RAW file: {path}")
-
-        try:
-            # NOTE: On Windows + cloud sync the filesystem creation time is unreliable.
-            # For all shot logic we always rely on the filesystem Modified Time (mtime).
-            mtime = os.path.getmtime(path)  # always use Modified time
-        except FileNotFoundError:
-            return
-
-        self._process_file(path, mtime)
-
-    def _process_file(self, path: Path, mtime: float):
-        path_str = str(path)
-
-        # Deduplicate by path + mtime
+        recorded = False
+        for path_str, mtime in entries:
+            # \U0001f525 DEBUG : confirme que handle_new_raw_file est bien appelé
+            self._log("INFO", f"[MANAGER] Handling new RAW file: {path_str}")
+            recorded |= self._process_file(path_str, mtime, save_state=False)
+
+        if recorded:
+            self._save_state()
+
+    def _mark_processed(self, path_str: str, mtime: float):
+        """Remember a RAW file as processed; call with self.lock held."""
+        processed = self.processed_files
+        # dicts keep insertion order: re-inserting moves the path to the end,
+        # so the first entry is always the least recently seen one
+        processed.pop(path_str, None)
+        processed[path_str] = mtime
+        cap = self.config.processed_files_cap
+        if cap > 0:
+            while len(processed) > cap:
+                del processed[next(iter(processed))]
+
+    def _process_file(self, path_str: str, mtime: float, *, save_state: bool = True) -> bool:
+        """Record and dispatch one RAW file. Returns True if it was recorded in files_by_date."""
+
+        # Deduplicate by path + mtime. Repeated events are the common case:
+        # check them without the lock (a single dict read is atomic), then
+        # check again under the lock before recording.
+        old_mtime = self.processed_files.get(path_str)
+        if old_mtime is not None and abs(old_mtime - mtime) < 1e-6:
+            return False
         with self.lock:
-            old_mtime = self.processed_files.get(path_str)
+            processed = self.processed_files
+            old_mtime = processed.get(path_str)
             if old_mtime is not None and abs(old_mtime - mtime) < 1e-6:
-                return
-            self.processed_files[path_str] = mtime
+                return False
+            self._mark_processed(path_str, mtime)
 
-        try:
-            rel = path.relative_to(self.raw_root)
-        except ValueError:
-            self._log("WARNING", f"File outside RAW root ignored: {path}")
-            return
+        parts = self._split_raw_path(path_str)
+        if parts is None:
+            self._log("WARNING", f"File outside RAW root ignored: {path_str}")
+            return False
 
-        if len(rel.parts) < 2:
-            self._log("WARNING", f"Unexpected RAW path structure: {path}")
-            return
+        if len(parts) < 2:
+            self._log("WARNING", f"Unexpected RAW path structure: {path_str}")
+            return False
 
-        main_folder = rel.parts[0]
+        # RAW/<camera>/<date>/...: the camera is always the first part
+        main_folder = parts[0]
         if main_folder not in self.config.folders:
-            self._log("INFO", f"Ignoring file from unknown folder '{main_folder}': {path}")
-            return
+            self._log("INFO", f"Ignoring file from unknown folder '{main_folder}': {path_str}")
+            return False
 
-        date_from_path = rel.parts[1] if len(rel.parts) >= 2 else None
-        filename = rel.parts[-1]
+        date_from_path = parts[1]
+        filename = parts[-1]
         filename_lower = filename.lower()
 
-        if any(kw.lower() in filename_lower for kw in self.config.test_keywords):
-            self._log("INFO", f"[TEST] Ignoring test image: {path}")
-            return
+        if any(kw in filename_lower for kw in self._test_keywords):
+            self._log("INFO", f"[TEST] Ignoring test image: {path_str}")
+            return False
 
         if not self.config.folder_matches(main_folder, filename_lower):
-            return
+            return False
 
         dt = datetime.fromtimestamp(mtime)
-        raw_date_str = date_from_path if date_from_path and re.match(r"^\d{8}$", date_from_path) else None
-        date_str = raw_date_str or format_dt_for_name(dt)[0]
-        time_str = format_dt_for_name(dt)[1]
+        mtime_date_str, time_str = format_dt_for_name(dt)
+        date_str = date_from_path if _DATE_DIR_RE.fullmatch(date_from_path) else mtime_date_str
 
         info = {
             "camera": main_folder,
@@ -1125,18 +1644,24 @@ class ShotManager:
 
         # Record this file in files_by_date
         with self.lock:
-            self.files_by_date.setdefault(date_str, []).append(info)
+            # Kept sorted by mtime so triggers can bisect into their window.
+            # Files mostly arrive in order, so this is normally an append.
+            date_dts = self.file_dts_by_date.setdefault(date_str, [])
+            idx = bisect_right(date_dts, dt)
+            date_dts.insert(idx, dt)
+            self.files_by_date.setdefault(date_str, []).insert(idx, info)
             self.last_seen_date_str = date_str
-        self._save_state()
 
-        # Trigger or not?
-        if self._is_trigger_file(main_folder, filename_lower):
+        # Trigger or not? The file already matched its folder's specs, which
+        # is all is_trigger_file() checks besides the folder's trigger flag.
+        if main_folder in self._trigger_folders:
             self._handle_trigger_file(info)
         else:
             self._handle_non_trigger_file(info)
-
-    def _is_trigger_file(self, camera: str, filename_lower: str) -> bool:
-        return self.config.is_trigger_file(camera, filename_lower)
+        # Saved once here, after any shot this file completed has been closed
+        if save_state:
+            self._save_state()
+        return True
 
     # =======================================================
     #  SHOT CREATION & ASSIGNMENT
@@ -1225,12 +1750,16 @@ class ShotManager:
 
                 images_by_camera = {}
                 date_files = self.files_by_date.get(file_date_str, [])
+                date_dts = self.file_dts_by_date.get(file_date_str, [])
+                # files_by_date is sorted by mtime: only look at the window slice
+                lo = bisect_left(date_dts, window_start)
+                hi = bisect_right(date_dts, window_end)
+                # Assigned files can never be collected again: drop them while
+                # scanning so the list only holds candidates for later triggers
+                remaining = []
 
                 # Collect all files in the full time window around this trigger
-                for finfo in date_files:
-                    fdt = finfo["dt"]
-                    if not (window_start <= fdt <= window_end):
-                        continue
+                for finfo in date_files[lo:hi]:
                     p = finfo["path"]
                     if p in self.assigned_files:
                         continue
@@ -1238,6 +1767,10 @@ class ShotManager:
                     if cam2 not in images_by_camera:
                         images_by_camera[cam2] = finfo
                         self.assigned_files.add(p)
+                        continue
+                    remaining.append(finfo)
+                date_files[lo:hi] = remaining
+                date_dts[lo:hi] = [finfo["dt"] for finfo in remaining]
 
                 # Make sure this trigger file is included
                 if camera not in images_by_camera:
@@ -1252,6 +1785,8 @@ class ShotManager:
                     "window_start": window_start,
                     "window_end": window_end,
                     "start_wall_time": datetime.now(),
+                    # Timeouts are measured on the monotonic clock, immune to clock changes
+                    "start_monotonic": time.monotonic(),
                     "images_by_camera": images_by_camera,
                     "status": "collecting",
                     # --- NEW FIELDS FOR LOGGING ---
@@ -1262,6 +1797,10 @@ class ShotManager:
                 shot_to_check = new_shot
                 new_shot_created = True
 
+        if new_shot_created:
+            # The worker loop sleeps while no shot is open: schedule its timeout
+            self.worker_wake.set()
+
         # If it's a brand new shot, log it nicely
         if new_shot_created:
             self._log(
@@ -1273,7 +1812,6 @@ class ShotManager:
 
         # Check if this shot is already complete
         self._maybe_close_if_complete(shot_to_check)
-        self._save_state()
 
     def _handle_non_trigger_file(self, info: dict):
         camera = info["camera"]
@@ -1326,19 +1864,17 @@ class ShotManager:
         """
         If all expected cameras are present in this shot, close it immediately
         (copy to CLEAN and set status / last_shot_state), without waiting for timeout.
+        The state is saved by the caller (_process_file / handle_new_raw_files).
         """
         with self.lock:
             if shot["status"] != "collecting":
                 return
-            expected = self.config.expected_folders
-            present = set(shot["images_by_camera"].keys())
-            missing = [c for c in expected if c not in present]
-            if missing:
+            if not self._expected_set.issubset(shot["images_by_camera"]):
                 return
             # Mark as closing and let _close_shot do the copy & final state
             shot["status"] = "closing"
 
-        self._close_shot(shot)
+        self._close_shot(shot, save_state=False)
 
         # Remove closed shots from list
         with self.lock:
@@ -1348,26 +1884,38 @@ class ShotManager:
     #  TIMEOUT CLOSING
     # =======================================================
 
+    def _next_timeout_delay(self) -> float | None:
+        """Seconds until the first collecting shot times out, None if there is none."""
+        timeout = self.config.timeout_s
+        with self.lock:
+            starts = [s["start_monotonic"] for s in self.open_shots if s["status"] == "collecting"]
+        if not starts:
+            return None
+        return max(0.0, min(starts) + timeout - time.monotonic())
+
     def _check_shot_timeouts(self):
-        now = datetime.now()
+        now = time.monotonic()
         timeout = self.config.timeout_s
         to_close = []
 
         with self.lock:
             for s in self.open_shots:
                 if s["status"] == "collecting":
-                    elapsed = (now - s["start_wall_time"]).total_seconds()
-                    if elapsed >= timeout:
+                    if now - s["start_monotonic"] >= timeout:
                         s["status"] = "closing"
                         to_close.append(s)
 
         for s in to_close:
-            self._close_shot(s)
+            self._close_shot(s, save_state=False)
 
         with self.lock:
             self.open_shots = [s for s in self.open_shots if s["status"] != "closed"]
 
-    def _close_shot(self, shot: dict):
+        # One state save for every shot closed in this tick
+        if to_close:
+            self._save_state()
+
+    def _close_shot(self, shot: dict, *, save_state: bool = True):
         date_str = shot["date_str"]
         idx = shot["shot_index"]
         images = shot["images_by_camera"]
@@ -1377,9 +1925,14 @@ class ShotManager:
 
         missing = [cam for cam in expected if cam not in images]
 
-        # Copy present data (all configured folders with available files)
-        for cam, finfo in images.items():
-            if cam in self.config.folders:
+        # Copy present data (all configured folders with available files).
+        # Cameras often write to different disks: copy them side by side.
+        copies = [(cam, finfo) for cam, finfo in images.items() if cam in self.config.folders]
+        if len(copies) > 1:
+            pool = self._get_copy_pool()
+            wait([pool.submit(self._copy_to_clean, idx, cam, finfo) for cam, finfo in copies])
+        else:
+            for cam, finfo in copies:
                 self._copy_to_clean(idx, cam, finfo)
 
         # ---- NEW: compute timing info for logging ----
@@ -1464,7 +2017,15 @@ class ShotManager:
             self._log("WARNING", f"Failed to compute motor positions for shot {idx:03d}: {exc}")
 
         shot["status"] = "closed"
-        self._save_state()
+        if save_state:
+            self._save_state()
+
+    def _get_copy_pool(self) -> ThreadPoolExecutor:
+        with self.lock:
+            if self._copy_pool is None:
+                workers = max(1, min(MAX_COPY_WORKERS, len(self.config.folders)))
+                self._copy_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clean-copy")
+            return self._copy_pool
 
     def _copy_to_clean(self, shot_index: int, cam: str, finfo: dict):
         src = Path(finfo["path"])
@@ -1476,13 +2037,20 @@ class ShotManager:
 
         date_str, time_str = format_dt_for_name(dt)
         dest_dir = self.clean_root / cam / date_str
-        ensure_dir(dest_dir)
+        self._ensure_dir_once(dest_dir)
 
         dest_name = f"{cam}_{date_str}_{time_str}_shot{shot_index:03d}{ext}"
         dest = dest_dir / dest_name
 
         try:
-            shutil.copy2(src, dest)
+            try:
+                copy_file_fast(src, dest)
+            except FileNotFoundError:
+                if dest_dir.exists():
+                    raise
+                # Folder removed while running: recreate it and retry once
+                ensure_dir(dest_dir)
+                copy_file_fast(src, dest)
             self._log("INFO", f"CLEAN copy: {src} -> {dest}")
         except Exception as e:
             self._log("ERROR", f"Failed to copy {src} -> {dest}: {e}")
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import csv
 import re
-from dataclasses import dataclass
-from datetime import date, datetime
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, time
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
 
 LoggerFn = Callable[[str, str], None]
 
@@ -16,8 +19,7 @@ def _log_message(logger: LoggerFn | None, level: str, message: str) -> None:
         logger(level, message)
 
 
-@dataclass
-class MotorEvent:
+class MotorEvent(NamedTuple):
     """Represents a motor movement event parsed from the history CSV."""
 
     time: datetime
@@ -28,50 +30,162 @@ class MotorEvent:
 
 
 class MotorStateManager:
-    """Compute motor positions at arbitrary timestamps based on initial values and events."""
+    """Compute motor positions at arbitrary timestamps based on initial values and events.
+
+    Events are stored column-wise (parallel lists sorted by time) so a query
+    bisects over the timestamps and only replays the motor/value pairs it needs.
+    """
 
     def __init__(self, initial_positions: Dict[str, float], events: Sequence[MotorEvent]):
         self.initial_positions = dict(initial_positions)
-        self.events: List[MotorEvent] = sorted(events, key=lambda e: e.time)
-        self.motor_names = set(initial_positions.keys()) | {evt.motor for evt in self.events}
+        ordered = sorted(events, key=lambda e: e.time)
+        self._times: List[datetime] = [evt.time for evt in ordered]
+        self._motors: List[str] = [evt.motor for evt in ordered]
+        self._old_pos: List[float | None] = [evt.old_pos for evt in ordered]
+        self._new_pos: List[float | None] = [evt.new_pos for evt in ordered]
+        self._time_only: List[bool] = [evt.time_only for evt in ordered]
+        # Position applied when replaying each event (None leaves the motor unchanged)
+        self._values: List[float | None] = [
+            new if new is not None else old for old, new in zip(self._old_pos, self._new_pos)
+        ]
+        self._search_keys, self._search_by_time_of_day = self._build_search_keys()
+        self.motor_names = set(initial_positions.keys()) | set(self._motors)
+
+        # Replay cursor for monotonic queries (see advance_to)
+        self._cursor_lock = threading.Lock()
+        self._cursor = 0
+        self._cursor_key = None
+        self._cursor_positions: Dict[str, float | None] = dict(self.initial_positions)
+
+    @property
+    def events(self) -> List[MotorEvent]:
+        """Events in chronological order, rebuilt from the column storage."""
+
+        return [
+            MotorEvent(time=t, motor=motor, old_pos=old, new_pos=new, time_only=time_only)
+            for t, motor, old, new, time_only in zip(
+                self._times, self._motors, self._old_pos, self._new_pos, self._time_only
+            )
+        ]
 
-    def get_positions_at(self, t: datetime) -> Dict[str, float | None]:
-        """Return motor positions at time ``t``.
+    def _build_search_keys(self) -> tuple[list | None, bool]:
+        """Return the sorted keys used to bisect queries.
 
-        The computation replays events in chronological order up to ``t`` starting
-        from the provided ``initial_positions``. The method is deliberately simple
-        for correctness; performance optimisations can be added later if required.
+        Time-only events are projected onto the query date, which preserves their
+        order only when they all share one anchor date; they are then searched by
+        time of day. Histories mixing both kinds have no single ordering and are
+        scanned linearly (keys ``None``).
         """
 
-        positions: Dict[str, float | None] = {k: v for k, v in self.initial_positions.items()}
-        for event in self.events:
-            event_time = event.time
-            if event.time_only:
+        if not any(self._time_only):
+            return self._times, False
+        if all(self._time_only) and len({t.date() for t in self._times}) == 1:
+            return [t.time() for t in self._times], True
+        return None, False
+
+    def _count_events_until(self, t: datetime) -> int:
+        """Return how many leading events apply at time ``t``."""
+
+        if self._search_keys is not None:
+            key = t.time() if self._search_by_time_of_day else t
+            return bisect_right(self._search_keys, key)
+
+        count = 0
+        for event_time, time_only in zip(self._times, self._time_only):
+            if time_only:
                 event_time = event_time.replace(year=t.year, month=t.month, day=t.day)
             if event_time > t:
                 break
-            if event.motor not in positions and event.motor not in self.motor_names:
-                self.motor_names.add(event.motor)
-            if event.new_pos is not None:
-                positions[event.motor] = event.new_pos
-            elif event.old_pos is not None:
-                positions[event.motor] = event.old_pos
+            count += 1
+        return count
+
+    def _apply_events(self, positions: Dict[str, float | None], start: int, stop: int) -> None:
+        for motor, value in zip(islice(self._motors, start, stop), islice(self._values, start, stop)):
+            if value is not None:
+                positions[motor] = value
             else:
-                positions.setdefault(event.motor, None)
+                positions.setdefault(motor, None)
+
+    def _with_all_motors(self, positions: Dict[str, float | None]) -> Dict[str, float | None]:
         # Ensure every known motor has a key so the CSV writer can emit columns
         for motor in self.motor_names:
             positions.setdefault(motor, None)
         return positions
 
+    def advance_to(self, t: datetime) -> Dict[str, float | None]:
+        """Return motor positions at ``t``, resuming from the previous query.
+
+        The manager remembers how far it replayed the history. Queries must be
+        monotonic (non-decreasing ``t``) for the fast path: each event is then
+        applied once across all calls, e.g. when shots close one after another.
+        A query earlier than the previous one restarts from the initial
+        positions. Histories mixing time-only and absolute events cannot be
+        bisected and are always replayed from the start.
+        """
+
+        if self._search_keys is None:
+            positions = dict(self.initial_positions)
+            self._apply_events(positions, 0, self._count_events_until(t))
+            return self._with_all_motors(positions)
+
+        key = t.time() if self._search_by_time_of_day else t
+        with self._cursor_lock:
+            if self._cursor_key is None or key < self._cursor_key:
+                self._cursor = 0
+                self._cursor_positions = dict(self.initial_positions)
+            count = bisect_right(self._search_keys, key)
+            self._apply_events(self._cursor_positions, self._cursor, count)
+            self._cursor = count
+            self._cursor_key = key
+            positions = dict(self._cursor_positions)
+        return self._with_all_motors(positions)
+
+    def get_positions_at(self, t: datetime) -> Dict[str, float | None]:
+        """Return motor positions at time ``t``.
+
+        The computation replays events in chronological order up to ``t`` starting
+        from the provided ``initial_positions``; increasing queries reuse the
+        previous replay through :meth:`advance_to`.
+        """
+
+        return self.advance_to(t)
+
+
+_DIALECT_SAMPLE_SIZE = 8192
 
-def _detect_dialect(path: Path) -> csv.Dialect:
-    sample = path.read_text(encoding="utf-8", errors="ignore")
+
+@lru_cache(maxsize=32)
+def _sniff_dialect(sample: str) -> csv.Dialect:
     try:
-        return csv.Sniffer().sniff(sample, delimiters=[",", ";", "\t"])  # type: ignore[arg-type]
+        return csv.Sniffer().sniff(sample, delimiters=",;\t")
     except Exception:
         return csv.get_dialect("excel")
 
 
+def _open_csv(path: Path, label: str):
+    """Open a CSV for reading, reporting a missing file with ``label``.
+
+    Opening directly instead of checking ``path.exists()`` first saves a stat
+    per parse, which matters on network shares.
+    """
+    try:
+        return path.open("r", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{label} CSV not found: {path}") from None
+
+
+def _detect_dialect_from_handle(f) -> csv.Dialect:
+    """Sniff the dialect from the head of an open text handle and rewind it.
+
+    Only the first few KB are inspected; the result is memoized on that sample
+    so re-parsing an unchanged file in the same session skips sniffing.
+    """
+
+    sample = f.read(_DIALECT_SAMPLE_SIZE)
+    f.seek(0)
+    return _sniff_dialect(sample)
+
+
 def _pick_column(header: Iterable[str], candidates: Iterable[str]) -> Optional[str]:
     lower_header = {col.lower(): col for col in header}
     for cand in candidates:
@@ -84,6 +198,17 @@ def _pick_column(header: Iterable[str], candidates: Iterable[str]) -> Optional[s
     return None
 
 
+def _iter_padded_rows(reader: Iterable[List[str]], width: int) -> Iterator[List[str]]:
+    """Yield non-blank rows padded to ``width`` so columns can be indexed directly."""
+
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+        yield row
+
+
 def _parse_float(value: str) -> Optional[float]:
     try:
         return float(value)
@@ -91,23 +216,72 @@ def _parse_float(value: str) -> Optional[float]:
         return None
 
 
-def _parse_datetime(value: str, *, fallback_date: date | None = None) -> tuple[Optional[datetime], bool]:
+_TIME_ONLY_RE = re.compile(r"\d{1,2}:\d{2}:\d{2}")
+_TIME_ONLY_FORMAT = "time"
+_ISO_FORMAT = "iso"
+
+
+def _detect_datetime_format(value: str) -> Optional[str]:
+    """Guess the timestamp layout of ``value`` from its separator positions.
+
+    Returns ``"time"`` for ``HH:MM:SS``, ``"iso"`` for ``YYYY-MM-DD...`` or a
+    ``strptime`` format string; ``None`` when the layout is not recognised.
+    """
+
     value = value.strip()
-    if not value:
-        return None, False
+    if _TIME_ONLY_RE.fullmatch(value):
+        return _TIME_ONLY_FORMAT
+    if len(value) > 4 and value[4] == "-":
+        return _ISO_FORMAT
+    if len(value) > 4 and value[4] == "/":
+        return "%Y/%m/%d %H:%M:%S"
+    if len(value) > 2 and value[2] == "/":
+        return "%d/%m/%Y %H:%M:%S"
+    return None
 
-    # Handle time-only inputs (HH:MM:SS) by anchoring them to the fallback date (or today)
-    if re.fullmatch(r"\d{1,2}:\d{2}:\d{2}", value):
-        base_date = fallback_date or date.today()
-        try:
+
+def _parse_with_format(value: str, fmt: str, fallback_date: date | None) -> tuple[Optional[datetime], bool]:
+    try:
+        if fmt == _TIME_ONLY_FORMAT:
+            if not _TIME_ONLY_RE.fullmatch(value):
+                return None, False
+            base_date = fallback_date or date.today()
             dt = datetime.strptime(value, "%H:%M:%S").replace(
                 year=base_date.year,
                 month=base_date.month,
                 day=base_date.day,
             )
             return dt, True
-        except Exception:
-            pass
+        if fmt == _ISO_FORMAT:
+            return datetime.fromisoformat(value), False
+        return datetime.strptime(value, fmt), False
+    except ValueError:
+        return None, False
+
+
+def _parse_datetime(
+    value: str, *, fallback_date: date | None = None, fmt: str | None = None
+) -> tuple[Optional[datetime], bool]:
+    """Parse a motor history timestamp.
+
+    When ``fmt`` (from :func:`_detect_datetime_format`) is given it is tried
+    first; the generic chain of parsers is only used if it does not match.
+    """
+
+    value = value.strip()
+    if not value:
+        return None, False
+
+    if fmt is not None:
+        dt, time_only = _parse_with_format(value, fmt, fallback_date)
+        if dt is not None:
+            return dt, time_only
+
+    # Handle time-only inputs (HH:MM:SS) by anchoring them to the fallback date (or today)
+    if fmt != _TIME_ONLY_FORMAT:
+        dt, time_only = _parse_with_format(value, _TIME_ONLY_FORMAT, fallback_date)
+        if dt is not None:
+            return dt, time_only
 
     parsers = [
         datetime.fromisoformat,
@@ -131,6 +305,39 @@ def _parse_datetime(value: str, *, fallback_date: date | None = None) -> tuple[O
     return None, False
 
 
+def _parse_datetime_column(
+    values: Sequence[str], *, fallback_date: date | None = None
+) -> List[tuple[Optional[datetime], bool]]:
+    """Parse a whole column of timestamps, returning ``(datetime, time_only)`` pairs.
+
+    The layout is detected once from the first non-empty value. Time-only and
+    ISO values go through the C ``fromisoformat`` parsers, repeated strings are
+    parsed only once, and anything the fast path rejects falls back to
+    :func:`_parse_datetime` so results are identical to a row-by-row parse.
+    """
+
+    fmt = next((_detect_datetime_format(v) for v in values if v), None)
+    base_date = fallback_date or date.today()
+    cache: Dict[str, tuple[Optional[datetime], bool]] = {}
+    results: List[tuple[Optional[datetime], bool]] = []
+    for value in values:
+        parsed = cache.get(value)
+        if parsed is None:
+            parsed = None, False
+            try:
+                if fmt == _TIME_ONLY_FORMAT and len(value) == 8 and _TIME_ONLY_RE.fullmatch(value):
+                    parsed = datetime.combine(base_date, time.fromisoformat(value)), True
+                elif fmt == _ISO_FORMAT:
+                    parsed = datetime.fromisoformat(value), False
+            except ValueError:
+                pass
+            if parsed[0] is None and value:
+                parsed = _parse_datetime(value, fallback_date=fallback_date, fmt=fmt)
+            cache[value] = parsed
+        results.append(parsed)
+    return results
+
+
 def parse_initial_positions(path: Path, logger: LoggerFn | None = None) -> tuple[Dict[str, float], Dict[str, str]]:
     """Parse a CSV containing initial motor positions.
 
@@ -142,20 +349,18 @@ def parse_initial_positions(path: Path, logger: LoggerFn | None = None) -> tuple
     is ``{motor_name: position}``.
     """
 
-    if not path.exists():
-        raise FileNotFoundError(f"Initial positions CSV not found: {path}")
-
-    dialect = _detect_dialect(path)
     positions: Dict[str, float] = {}
     axis_to_motor: Dict[str, str] = {}
 
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, dialect=dialect)
-        if not reader.fieldnames:
+    with _open_csv(path, "Initial positions") as f:
+        dialect = _detect_dialect_from_handle(f)
+        reader = csv.reader(f, dialect=dialect)
+        header = next(reader, None)
+        if not header:
             raise ValueError("Initial positions CSV has no header")
-        motor_col = _pick_column(reader.fieldnames, ["motor", "name", "motor_name"])
-        axis_col = _pick_column(reader.fieldnames, ["axis", "axis_name"])
-        pos_col = _pick_column(reader.fieldnames, ["position", "pos", "value"])
+        motor_col = _pick_column(header, ["motor", "name", "motor_name"])
+        axis_col = _pick_column(header, ["axis", "axis_name"])
+        pos_col = _pick_column(header, ["position", "pos", "value"])
         if motor_col is None or pos_col is None:
             raise ValueError(
                 "Could not find motor/position columns in initial positions CSV."
@@ -166,13 +371,16 @@ def parse_initial_positions(path: Path, logger: LoggerFn | None = None) -> tuple
                 "WARNING",
                 "Initial positions CSV is missing an axis column; motor history will not be mapped to names.",
             )
-        for row_idx, row in enumerate(reader, start=2):
-            motor = (row.get(motor_col) or "").strip()
+        motor_i = header.index(motor_col)
+        axis_i = header.index(axis_col) if axis_col else None
+        pos_i = header.index(pos_col)
+        for row_idx, row in enumerate(_iter_padded_rows(reader, len(header)), start=2):
+            motor = row[motor_i].strip()
             if not motor:
                 _log_message(logger, "WARNING", f"Skipping row {row_idx}: missing motor name")
                 continue
-            axis = (row.get(axis_col) or "").strip() if axis_col else ""
-            pos = _parse_float(row.get(pos_col, ""))
+            axis = row[axis_i].strip() if axis_i is not None else ""
+            pos = _parse_float(row[pos_i])
             if pos is None:
                 _log_message(
                     logger,
@@ -209,63 +417,78 @@ def parse_motor_history(
     so they can be projected onto the shot date when computing positions.
     """
 
-    if not path.exists():
-        raise FileNotFoundError(f"Motor history CSV not found: {path}")
-
-    dialect = _detect_dialect(path)
     events: List[MotorEvent] = []
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f, dialect=dialect)
-        if not reader.fieldnames:
+    with _open_csv(path, "Motor history") as f:
+        dialect = _detect_dialect_from_handle(f)
+        reader = csv.reader(f, dialect=dialect)
+        header = next(reader, None)
+        if not header:
             raise ValueError("Motor history CSV has no header")
-        motor_col = _pick_column(reader.fieldnames, ["motor", "name", "axis"])
-        time_col = _pick_column(reader.fieldnames, ["time", "timestamp", "date"])
-        new_col = _pick_column(reader.fieldnames, ["new", "position", "pos", "value", "new_pos"])
-        old_col = _pick_column(reader.fieldnames, ["old", "previous", "old_pos", "from"])
+        motor_col = _pick_column(header, ["motor", "name", "axis"])
+        time_col = _pick_column(header, ["time", "timestamp", "date"])
+        new_col = _pick_column(header, ["new", "position", "pos", "value", "new_pos"])
+        old_col = _pick_column(header, ["old", "previous", "old_pos", "from"])
         if motor_col is None or time_col is None or new_col is None:
             raise ValueError(
                 "Could not find required columns (time, motor, new position) in motor history CSV."
             )
-        for row_idx, row in enumerate(reader, start=2):
-            axis_or_motor = (row.get(motor_col) or "").strip()
-            raw_time = (row.get(time_col) or "").strip()
-            if not axis_or_motor or not raw_time:
-                _log_message(
-                    logger,
-                    "WARNING",
-                    f"Skipping row {row_idx}: missing motor or timestamp",
-                )
-                continue
-            dt, time_only = _parse_datetime(raw_time, fallback_date=fallback_date)
-            if dt is None:
+        motor_i = header.index(motor_col)
+        time_i = header.index(time_col)
+        new_i = header.index(new_col)
+        old_i = header.index(old_col) if old_col else None
+        raw_rows = [
+            (
+                row_idx,
+                row[motor_i].strip(),
+                row[time_i].strip(),
+                row[old_i] if old_i is not None else None,
+                row[new_i],
+            )
+            for row_idx, row in enumerate(_iter_padded_rows(reader, len(header)), start=2)
+        ]
+
+    parsed_times = _parse_datetime_column(
+        [raw_time for _, _, raw_time, _, _ in raw_rows], fallback_date=fallback_date
+    )
+    for (row_idx, axis_or_motor, raw_time, raw_old, raw_new), (dt, time_only) in zip(
+        raw_rows, parsed_times
+    ):
+        if not axis_or_motor or not raw_time:
+            _log_message(
+                logger,
+                "WARNING",
+                f"Skipping row {row_idx}: missing motor or timestamp",
+            )
+            continue
+        if dt is None:
+            _log_message(
+                logger,
+                "WARNING",
+                f"Skipping row {row_idx}: could not parse timestamp '{raw_time}'",
+            )
+            continue
+        motor_name = axis_or_motor
+        if axis_to_motor is not None:
+            motor_name = axis_to_motor.get(axis_or_motor, "")
+            if not motor_name:
                 _log_message(
                     logger,
                     "WARNING",
-                    f"Skipping row {row_idx}: could not parse timestamp '{raw_time}'",
+                    f"Skipping row {row_idx}: unknown axis '{axis_or_motor}'",
                 )
                 continue
-            motor_name = axis_or_motor
-            if axis_to_motor is not None:
-                motor_name = axis_to_motor.get(axis_or_motor, "")
-                if not motor_name:
-                    _log_message(
-                        logger,
-                        "WARNING",
-                        f"Skipping row {row_idx}: unknown axis '{axis_or_motor}'",
-                    )
-                    continue
-
-            old_pos = _parse_float(row.get(old_col, "")) if old_col else None
-            new_pos = _parse_float(row.get(new_col, ""))
-            events.append(
-                MotorEvent(
-                    time=dt,
-                    motor=motor_name,
-                    old_pos=old_pos,
-                    new_pos=new_pos,
-                    time_only=time_only,
-                )
+
+        old_pos = _parse_float(raw_old) if raw_old is not None else None
+        new_pos = _parse_float(raw_new)
+        events.append(
+            MotorEvent(
+                time=dt,
+                motor=motor_name,
+                old_pos=old_pos,
+                new_pos=new_pos,
+                time_only=time_only,
             )
+        )
     events.sort(key=lambda e: e.time)
     return events
 
@@ -3,16 +3,82 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+import errno
+import os
 import re
+import shutil
+
+_SHOT_IDX_RE = re.compile(r"_shot(\d+)\.")
+
+# Filesystems where native change notifications are missing or unreliable
+_NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb", "smb2", "smb3", "smbfs", "9p", "fuse.sshfs"}
+
+# copy_file_range errors meaning "not possible here", handled by the fallback copy
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
 
 
 def ensure_dir(path: Path):
     path.mkdir(parents=True, exist_ok=True)
 
 
+def atomic_write_bytes(path: Path, data: bytes):
+    """
+    Write ``data`` to ``path`` through a temporary file in the same folder
+    and an atomic rename, so a crash mid-write never leaves a truncated file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def copy_file_fast(src: str | Path, dst: str | Path):
+    """
+    Copy ``src`` to ``dst`` and carry over its access/modification times.
+    Unlike shutil.copy2, permission bits and extended attributes are not copied.
+
+    Where available (Linux), the data is copied inside the kernel with
+    os.copy_file_range, which becomes a reflink on copy-on-write filesystems.
+    Otherwise shutil.copyfile is used (sendfile on Linux, 1 MiB buffer on Windows).
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    copied = False
+    st = None
+    if copy_range is not None:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            st = os.fstat(fsrc.fileno())
+            total = 0
+            try:
+                while True:
+                    n = copy_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                    if n == 0:
+                        break
+                    total += n
+                # Some filesystems report success without copying anything
+                copied = total > 0 or st.st_size == 0
+            except OSError as e:
+                if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+    if not copied:
+        shutil.copyfile(src, dst)
+        if st is None:
+            st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def format_dt_for_name(dt: datetime):
-    date_str = dt.strftime("%Y%m%d")
-    time_str = dt.strftime("%H%M%S")
+    # Same as strftime("%Y%m%d") / strftime("%H%M%S"), without the format parsing
+    date_str = f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+    time_str = f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
     return date_str, time_str
 
 
@@ -22,10 +88,49 @@ def extract_shot_index_from_name(filename: str):
         Cam_YYYYMMDD_HHMMSS_shotNNN.tif
     Returns int or None.
     """
-    m = re.search(r"_shot(\d+)\.", filename)
+    # Fast path for names written by ShotLog: the first "_shot" is the one
+    num, dot, _ = filename.partition("_shot")[2].partition(".")
+    if dot and num.isascii() and num.isdigit():
+        return int(num)
+
+    m = _SHOT_IDX_RE.search(filename)
     if not m:
         return None
     try:
         return int(m.group(1))
     except ValueError:
         return None
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    Best-effort check whether ``path`` lives on a network filesystem
+    (NFS / SMB share, mapped network drive, WSL 9P mount...).
+    Returns False when the filesystem type cannot be determined.
+    """
+    target = os.path.realpath(path)
+    if os.name == "nt":
+        if target.startswith("\\\\"):
+            return True
+        try:
+            import ctypes
+
+            drive = os.path.splitdrive(target)[0] + "\\"
+            return ctypes.windll.kernel32.GetDriveTypeW(drive) == 4  # DRIVE_REMOTE
+        except Exception:
+            return False
+
+    best_mount, fstype = "", ""
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount = parts[1].replace("\\040", " ")
+                prefix = mount.rstrip("/") + "/"
+                if (target == mount or target.startswith(prefix)) and len(mount) > len(best_mount):
+                    best_mount, fstype = mount, parts[2]
+    except OSError:
+        return False
+    return fstype in _NETWORK_FS_TYPES